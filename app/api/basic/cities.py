@@ -1,6 +1,6 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import Dict, Any, List, Set
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import httpx
 from collections import defaultdict
 
@@ -19,6 +19,8 @@ class PrefecturesResponse(BaseModel):
     count: int = Field(..., description="都道府県数")
 
 class HealthResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="ステータス")
     loaded_prefectures: int = Field(..., description="読み込み済み都道府県数")
 
@@ -278,18 +280,20 @@ async def get_cities_by_query(
     return CitiesResponse(**result)
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     ヘルスチェック用エンドポイント
     
     Returns:
-        HealthResponse: システムの健康状態
+        HealthResponse: システムの健康状態（JSON にシリアライズ済み）
     """
     # データが読み込まれていない場合は読み込み
     if not city_api.is_loaded:
         await city_api.load_address_data()
     
-    return HealthResponse(
+    health = HealthResponse(
         status="healthy",
         loaded_prefectures=len(city_api.cities_by_prefecture)
     )
+    # 構築済みのモデルを Pydantic で直接 JSON 化し、FastAPI による再検証・再シリアライズを省く
+    return Response(content=health.model_dump_json(), media_type="application/json")
@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 import logging
 
-from app.services.email_service import email_service
+from app.services.email_service import get_email_service
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ async def send_first_email() -> Dict[str, Any]:
     
     try:
         # メール送信サービスを呼び出し
-        result = await email_service.send_first_email()
+        result = await get_email_service().send_first_email()
         
         if result["status"] == "success":
             logger.info(f"メール送信成功: {result}")
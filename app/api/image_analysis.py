@@ -12,9 +12,10 @@ from app.models.image_analysis import ImageAnalysis
 from app.schemas.image_analysis import (
     AnalysisResponse, 
     AnalysisHistoryResponse, 
-    AnalysisStats
+    AnalysisStats,
+    AzureAnalysisPayload
 )
-from app.services.azure_vision import azure_vision_service
+from app.services.azure_vision import get_azure_vision_service
 from app.services.image_processing import image_processing_service
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,7 @@ async def analyze_image(
     Returns:
         Analysis results with Azure AI Vision data
     """
+    azure_vision_service = get_azure_vision_service()
     if not azure_vision_service:
         raise HTTPException(
             status_code=503,
@@ -54,13 +56,18 @@ async def analyze_image(
         if ocr_results:
             azure_analysis['ocr'] = ocr_results
         
-        # Save analysis results to database
+        # Validate against the response schema before anything is committed,
+        # so a malformed payload cleans up the file instead of leaving a row behind
+        payload = AzureAnalysisPayload.model_validate(azure_analysis)
+        
+        # Save analysis results to database. exclude_unset keeps the stored JSON to the
+        # keys Azure actually returned (the history endpoint checks key presence)
         db_analysis = ImageAnalysis(
             filename=file_info['filename'],
             file_path=file_info['file_path'],
             file_size=file_info['file_size'],
             content_type=file_info['content_type'],
-            azure_analysis=azure_analysis
+            azure_analysis=payload.model_dump(exclude_unset=True)
         )
         
         db.add(db_analysis)
@@ -69,7 +76,17 @@ async def analyze_image(
         
         logger.info(f"Successfully analyzed image: {file_info['filename']} (ID: {db_analysis.id})")
         
-        return db_analysis
+        # Hand the already-validated payload to the response instead of re-validating the stored JSON
+        return AnalysisResponse(
+            id=db_analysis.id,
+            filename=db_analysis.filename,
+            file_path=db_analysis.file_path,
+            file_size=db_analysis.file_size,
+            content_type=db_analysis.content_type,
+            azure_analysis=payload,
+            created_at=db_analysis.created_at,
+            updated_at=db_analysis.updated_at,
+        )
         
     except HTTPException:
         # Re-raise HTTP exceptions (validation errors, etc.)
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import insert, select, and_, or_
 from typing import List, Optional
 from app.core.database import get_db
 from app.models.todo import Todo
-from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse, TodoListResponse
+from app.schemas.todo import TodoCreate, TodoBulkCreate, TodoUpdate, TodoResponse, TodoListResponse
 from app.utils.datetime_utils import get_jst_now, format_jst
 
 router = APIRouter()
@@ -113,6 +113,28 @@ async def create_todo(
     return format_todo_response(db_todo)
 
 
+@router.post("/bulk", response_model=TodoListResponse)
+async def create_todos_bulk(
+    payload: TodoBulkCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """複数のTodoを1回のINSERTでまとめて作成（レスポンスは入力と同じ順序）"""
+    # render_nulls: None を含む行も同じ列構成で扱い、INSERT を1文にまとめる
+    result = await db.scalars(
+        insert(Todo)
+        .returning(Todo, sort_by_parameter_order=True)
+        .execution_options(render_nulls=True),
+        [item.model_dump() for item in payload.items],
+    )
+    todos = result.all()
+    await db.commit()
+    
+    return TodoListResponse(
+        total=len(todos),
+        items=[format_todo_response(todo) for todo in todos]
+    )
+
+
 @router.patch("/{todo_id}", response_model=TodoResponse)
 async def update_todo(
     todo_id: int,
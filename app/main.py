@@ -1,19 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import image_analysis, products, profiles, todos, email, population
 from app.api.basic import cities, func
 from app.api.strand import router as strand_router
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.services.email_service import close_email_service
 
 
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 使い回しているSMTP接続を閉じる
+    await close_email_service()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    description="FastAPI application connected to Neon PostgreSQL database"
+    description="FastAPI application connected to Neon PostgreSQL database",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -80,36 +94,41 @@ app.include_router(
     tags=["population"]
 )
 
+# Static response bodies (no per-request work; handlers stay async so they run on the event loop)
+ROOT_RESPONSE = {
+    "message": "Welcome to FastAPI with Neon PostgreSQL!",
+    "project": settings.PROJECT_NAME,
+    "version": settings.VERSION,
+    "docs": "/docs",
+    "endpoints": {
+        "profiles": f"{settings.API_V1_STR}/profiles",
+        "products": f"{settings.API_V1_STR}/products",
+        "product_results_list": f"{settings.API_V1_STR}/products/result",
+        "image_analysis": f"{settings.API_V1_STR}/images",
+        "todos": f"{settings.API_V1_STR}/todos",
+        "email_service": f"{settings.API_V1_STR}/email/first",
+        "basic_functions": f"{settings.API_V1_STR}/basic/hello",
+        "japanese_cities": f"{settings.API_V1_STR}/basic/cities",
+        "strand_basic": f"{settings.API_V1_STR}/strand/basic",
+        "population_1990": f"{settings.API_V1_STR}/population/1990",
+        "population_1990_over_4_million": f"{settings.API_V1_STR}/population/1990/over4million",
+        "population_1990_series": f"{settings.API_V1_STR}/population/1990_series",
+        "population_1980_2000": f"{settings.API_V1_STR}/population/1980_2000",
+        "population_1980_2000_over_2_million": f"{settings.API_V1_STR}/population/1980_2000/over2million",
+    }
+}
+
+HEALTH_RESPONSE = {
+    "status": "healthy",
+    "message": "FastAPI with Neon PostgreSQL is running successfully"
+}
+
 # Root endpoint
 @app.get("/")
 async def root():
-    return {
-        "message": "Welcome to FastAPI with Neon PostgreSQL!",
-        "project": settings.PROJECT_NAME,
-        "version": settings.VERSION,
-        "docs": "/docs",
-        "endpoints": {
-            "profiles": f"{settings.API_V1_STR}/profiles",
-            "products": f"{settings.API_V1_STR}/products",
-            "product_results_list": f"{settings.API_V1_STR}/products/result",
-            "image_analysis": f"{settings.API_V1_STR}/images",
-            "todos": f"{settings.API_V1_STR}/todos",
-            "email_service": f"{settings.API_V1_STR}/email/first",
-            "basic_functions": f"{settings.API_V1_STR}/basic/hello",
-            "japanese_cities": f"{settings.API_V1_STR}/basic/cities",
-            "strand_basic": f"{settings.API_V1_STR}/strand/basic",
-            "population_1990": f"{settings.API_V1_STR}/population/1990",
-            "population_1990_over_4_million": f"{settings.API_V1_STR}/population/1990/over4million",
-            "population_1990_series": f"{settings.API_V1_STR}/population/1990_series",
-            "population_1980_2000": f"{settings.API_V1_STR}/population/1980_2000",
-            "population_1980_2000_over_2_million": f"{settings.API_V1_STR}/population/1980_2000/over2million",
-        }
-    }
+    return ROOT_RESPONSE
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "message": "FastAPI with Neon PostgreSQL is running successfully"
-    }
+    return HEALTH_RESPONSE
@@ -1,7 +1,7 @@
 from .product_result import ProductResultResponse
 from .products import ProductBase, ProductCreate, ProductResponse
 from .profiles import ProfileBase, ProfileCreate, ProfileResponse
-from .todo import TodoBase, TodoCreate, TodoUpdate, TodoResponse, TodoListResponse, Priority
+from .todo import TodoBase, TodoCreate, TodoBulkCreate, TodoUpdate, TodoResponse, TodoListResponse, Priority
 
 # Update forward references after import
 ProfileResponse.model_rebuild()
@@ -9,6 +9,6 @@ ProfileResponse.model_rebuild()
 __all__ = [
     "ProfileBase", "ProfileCreate", "ProfileResponse", 
     "ProductBase", "ProductCreate", "ProductResponse",
-    "TodoBase", "TodoCreate", "TodoUpdate", "TodoResponse", "TodoListResponse", "Priority",
+    "TodoBase", "TodoCreate", "TodoBulkCreate", "TodoUpdate", "TodoResponse", "TodoListResponse", "Priority",
     "ProductResultResponse",
 ]
@@ -1,15 +1,116 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+from typing import Annotated, Optional, Dict, Any, List, TypeVar
 from datetime import datetime
 from uuid import UUID
 
 
+# Azure AI Vision analysis payload (mirrors AzureVisionService._format_analysis_result)
+# The SDK's msrest models default every attribute to None, so every SDK-derived
+# field is optional, lists treat None as empty, and unknown keys are kept.
+
+T = TypeVar("T")
+
+
+def _none_to_empty_list(value: Any) -> Any:
+    return [] if value is None else value
+
+
+NoneAsEmptyList = Annotated[List[T], BeforeValidator(_none_to_empty_list)]
+
+
+class AzureModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class BoundingRectangle(AzureModel):
+    x: Optional[int] = None
+    y: Optional[int] = None
+    w: Optional[int] = None
+    h: Optional[int] = None
+
+
+class TagResult(AzureModel):
+    name: Optional[str] = None
+    confidence: Optional[float] = None
+
+
+class CaptionResult(AzureModel):
+    text: Optional[str] = None
+    confidence: Optional[float] = None
+
+
+class DescriptionResult(AzureModel):
+    captions: NoneAsEmptyList[CaptionResult] = []
+    tags: NoneAsEmptyList[str] = []
+
+
+class CategoryResult(AzureModel):
+    name: Optional[str] = None
+    score: Optional[float] = None
+
+
+class ColorResult(AzureModel):
+    dominant_color_foreground: Optional[str] = None
+    dominant_color_background: Optional[str] = None
+    dominant_colors: NoneAsEmptyList[str] = []
+    accent_color: Optional[str] = None
+    is_bw_img: Optional[bool] = None
+
+
+class DetectedObjectResult(AzureModel):
+    object_property: Optional[str] = None
+    confidence: Optional[float] = None
+    rectangle: Optional[BoundingRectangle] = None
+
+
+class BrandResult(AzureModel):
+    name: Optional[str] = None
+    confidence: Optional[float] = None
+    rectangle: Optional[BoundingRectangle] = None
+
+
+class ImageTypeResult(AzureModel):
+    clip_art_type: Optional[int] = None
+    line_drawing_type: Optional[int] = None
+
+
+class AdultResult(AzureModel):
+    is_adult_content: Optional[bool] = None
+    adult_score: Optional[float] = None
+    is_racy_content: Optional[bool] = None
+    racy_score: Optional[float] = None
+    is_gory_content: Optional[bool] = None
+    gore_score: Optional[float] = None
+
+
+class OcrLine(AzureModel):
+    text: Optional[str] = None
+    bounding_box: NoneAsEmptyList[float] = []
+
+
+class OcrResult(AzureModel):
+    status: Optional[str] = None
+    text_results: NoneAsEmptyList[OcrLine] = []
+
+
+class AzureAnalysisPayload(AzureModel):
+    tags: Optional[List[TagResult]] = None
+    description: Optional[DescriptionResult] = None
+    categories: Optional[List[CategoryResult]] = None
+    color: Optional[ColorResult] = None
+    objects: Optional[List[DetectedObjectResult]] = None
+    brands: Optional[List[BrandResult]] = None
+    image_type: Optional[ImageTypeResult] = None
+    adult: Optional[AdultResult] = None
+    ocr: Optional[OcrResult] = None
+
+
 class AnalysisBase(BaseModel):
     filename: str
     file_path: str
     file_size: int
     content_type: str
-    azure_analysis: Optional[Dict[str, Any]] = None
+    azure_analysis: Optional[AzureAnalysisPayload] = None
 
 
 class AnalysisCreate(AnalysisBase):
@@ -21,6 +21,11 @@ class TodoCreate(TodoBase):
     pass
 
 
+class TodoBulkCreate(BaseModel):
+    """Todo一括作成用スキーマ"""
+    items: list[TodoCreate] = Field(..., min_length=1, max_length=1000, description="作成するTodoの一覧")
+
+
 class TodoUpdate(BaseModel):
     """Todo更新用スキーマ（部分更新対応）"""
     title: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -1,12 +1,17 @@
 from azure.cognitiveservices.vision.computervision import ComputerVisionClient
 from azure.cognitiveservices.vision.computervision.models import VisualFeatureTypes
 from msrest.authentication import CognitiveServicesCredentials
-from typing import Dict, Any, Optional
+from functools import cache
+from typing import Dict, Any, List, Optional
+import asyncio
 import logging
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent requests for batch analysis
+MAX_CONCURRENT_ANALYSES = 8
+
 
 class AzureVisionService:
     def __init__(self):
@@ -29,35 +34,62 @@ class AzureVisionService:
             Dictionary containing analysis results
         """
         try:
-            with open(image_path, "rb") as image_data:
-                # Define what visual features we want to analyze
-                visual_features = [
-                    VisualFeatureTypes.tags,
-                    VisualFeatureTypes.description,
-                    VisualFeatureTypes.categories,
-                    VisualFeatureTypes.color,
-                    VisualFeatureTypes.image_type,
-                    VisualFeatureTypes.objects,
-                    VisualFeatureTypes.brands,
-                    VisualFeatureTypes.adult
-                ]
-                
-                # Call the API
-                analysis = self.client.analyze_image_in_stream(
-                    image_data,
-                    visual_features=visual_features
-                )
-                
-                # Convert to dictionary
-                result = self._format_analysis_result(analysis)
-                
-                logger.info(f"Successfully analyzed image: {image_path}")
-                return result
+            # The SDK client is blocking, so run the request in a worker thread
+            result = await asyncio.to_thread(self._analyze_image_sync, image_path)
+            logger.info(f"Successfully analyzed image: {image_path}")
+            return result
                 
         except Exception as e:
             logger.error(f"Error analyzing image {image_path}: {str(e)}")
             raise
     
+    async def analyze_images(
+        self,
+        image_paths: List[str],
+        max_concurrency: int = MAX_CONCURRENT_ANALYSES
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several images concurrently
+        
+        Args:
+            image_paths: Paths to the image files
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Analysis results in the same order as image_paths
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_one(image_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_image(image_path)
+        
+        return await asyncio.gather(*(analyze_one(path) for path in image_paths))
+    
+    def _analyze_image_sync(self, image_path: str) -> Dict[str, Any]:
+        """Call the Analyze Image API and format the response (blocking)"""
+        with open(image_path, "rb") as image_data:
+            # Define what visual features we want to analyze
+            visual_features = [
+                VisualFeatureTypes.tags,
+                VisualFeatureTypes.description,
+                VisualFeatureTypes.categories,
+                VisualFeatureTypes.color,
+                VisualFeatureTypes.image_type,
+                VisualFeatureTypes.objects,
+                VisualFeatureTypes.brands,
+                VisualFeatureTypes.adult
+            ]
+            
+            # Call the API
+            analysis = self.client.analyze_image_in_stream(
+                image_data,
+                visual_features=visual_features
+            )
+            
+            # Convert to dictionary
+            return self._format_analysis_result(analysis)
+    
     def _format_analysis_result(self, analysis) -> Dict[str, Any]:
         """
         Format the Azure API response into a structured dictionary
@@ -212,5 +244,14 @@ class AzureVisionService:
             return None
 
 
-# Global instance
-azure_vision_service = AzureVisionService() if settings.AZURE_VISION_KEY and settings.AZURE_VISION_ENDPOINT else None
\ No newline at end of file
+@cache
+def get_azure_vision_service() -> Optional[AzureVisionService]:
+    """
+    Return the shared AzureVisionService, creating it on first use
+    
+    Returns:
+        The service instance, or None if Azure Vision is not configured
+    """
+    if not settings.AZURE_VISION_KEY or not settings.AZURE_VISION_ENDPOINT:
+        return None
+    return AzureVisionService()
@@ -1,15 +1,50 @@
+import asyncio
 import smtplib
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any
+import base64
+from email.header import Header
+from email.utils import formataddr, parseaddr
+from string import Template
+from typing import Dict, Any, Optional
 from datetime import datetime
+from functools import cache
 import logging
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+FIRST_EMAIL_SUBJECT = "FastAPI メール送信テスト - 初回メール"
+
+# 件名は固定なので RFC 2047 形式へのエンコードは一度だけ行う
+_FIRST_EMAIL_SUBJECT_HEADER = Header(FIRST_EMAIL_SUBJECT, "utf-8").encode(linesep="\r\n")
+
+
+def _encode_address(address: str) -> str:
+    """「表示名 <アドレス>」形式のアドレスを、表示名だけ RFC 2047 でエンコードする"""
+    return formataddr(parseaddr(address), charset="utf-8")
+
+# 本文テンプレート（送信ごとに変わるのは送信時刻のみ）
+_FIRST_EMAIL_BODY = Template("""
+お疲れさまです。
+
+FastAPI からの自動送信メールです。
+/api/v1/email/first エンドポイントが正常に呼び出されました。
+
+【送信情報】
+送信時刻: $sent_at
+送信者: $from_email
+受信者: $to_email
+システム: FastAPI Email Service
+
+このメールは API エンドポイントのテスト用として送信されています。
+メール送信機能が正常に動作していることを確認できました。
+
+何かご質問がございましたら、開発チームまでお知らせください。
+
+FastAPI 自動メール送信システム
+""")
+
 
 class EmailService:
     """シンプルなメール送信サービス"""
@@ -21,6 +56,76 @@ class EmailService:
         self.password = settings.EMAIL_PASSWORD
         self.from_email = settings.EMAIL_FROM
         self.to_email = settings.EMAIL_TO
+        
+        # 送信ごとの STARTTLS / 認証を避けるため SMTP 接続を使い回す
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._lock = asyncio.Lock()
+        
+        # 送信者・受信者は固定なので、ヘッダー部分は事前にエンコードしてバイト列化しておく
+        # （日本語の表示名もエンコード後は ASCII に収まる）
+        self._first_email_headers = (
+            f"From: {_encode_address(self.from_email)}\r\n"
+            f"To: {_encode_address(self.to_email)}\r\n"
+            f"Subject: {_FIRST_EMAIL_SUBJECT_HEADER}\r\n"
+            "MIME-Version: 1.0\r\n"
+            'Content-Type: text/plain; charset="utf-8"\r\n'
+            "Content-Transfer-Encoding: base64\r\n"
+            "\r\n"
+        ).encode("ascii")
+    
+    def _build_first_email(self, sent_at: str) -> bytes:
+        """初回メールの送信用バイト列を組み立てる"""
+        body = _FIRST_EMAIL_BODY.substitute(
+            sent_at=sent_at,
+            from_email=self.from_email,
+            to_email=self.to_email,
+        )
+        encoded_body = base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n")
+        return self._first_email_headers + encoded_body
+    
+    def _connect(self) -> smtplib.SMTP:
+        """SMTPサーバーに接続し、STARTTLS と認証を行う（ブロッキング）"""
+        context = ssl.create_default_context()
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            server.starttls(context=context)
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _is_connected(self) -> bool:
+        """保持している接続が生きているか NOOP で確認（ブロッキング）"""
+        if self._smtp is None:
+            return False
+        try:
+            return self._smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _drop_connection(self) -> None:
+        """保持している接続を破棄"""
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+    
+    async def _get_conn(self) -> smtplib.SMTP:
+        """再利用可能なSMTP接続を取得（切断されていれば再接続）"""
+        if not await asyncio.to_thread(self._is_connected):
+            self._drop_connection()
+            self._smtp = await asyncio.to_thread(self._connect)
+        return self._smtp
+    
+    async def aclose(self) -> None:
+        """保持しているSMTP接続を QUIT して閉じる（アプリ終了時）"""
+        async with self._lock:
+            if self._smtp is not None:
+                try:
+                    await asyncio.to_thread(self._smtp.quit)
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._drop_connection()
     
     async def send_first_email(self) -> Dict[str, Any]:
         """
@@ -28,44 +133,22 @@ class EmailService:
         固定の送信者・受信者でシンプルなメールを送信
         """
         try:
-            # メールの内容を作成
-            subject = "FastAPI メール送信テスト - 初回メール"
-            body = f"""
-お疲れさまです。
-
-FastAPI からの自動送信メールです。
-/api/v1/email/first エンドポイントが正常に呼び出されました。
-
-【送信情報】
-送信時刻: {datetime.now().strftime('%Y年%m月%d日 %H時%M分%S秒')}
-送信者: {self.from_email}
-受信者: {self.to_email}
-システム: FastAPI Email Service
-
-このメールは API エンドポイントのテスト用として送信されています。
-メール送信機能が正常に動作していることを確認できました。
-
-何かご質問がございましたら、開発チームまでお知らせください。
-
-FastAPI 自動メール送信システム
-            """
-            
-            # メールメッセージを作成
-            message = MIMEMultipart()
-            message["From"] = self.from_email
-            message["To"] = self.to_email
-            message["Subject"] = subject
+            # 送信時刻だけを差し込んでメッセージを組み立てる
+            message = self._build_first_email(
+                datetime.now().strftime('%Y年%m月%d日 %H時%M分%S秒')
+            )
             
-            # メール本文を添付
-            message.attach(MIMEText(body, "plain", "utf-8"))
-            
-            # SMTP接続してメール送信
-            context = ssl.create_default_context()
-            
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.username, self.password)
-                server.sendmail(self.from_email, self.to_email, message.as_string())
+            # SMTP接続（再利用）してメール送信
+            async with self._lock:
+                server = await self._get_conn()
+                try:
+                    await asyncio.to_thread(
+                        server.sendmail, self.from_email, self.to_email, message
+                    )
+                except Exception:
+                    # 接続状態が不明になるため、次回は新しく接続し直す
+                    self._drop_connection()
+                    raise
             
             logger.info(f"Email sent successfully from {self.from_email} to {self.to_email}")
             
@@ -75,7 +158,7 @@ FastAPI 自動メール送信システム
                 "details": "自動メール送信が完了しました。受信者のメールボックスをご確認ください。",
                 "from": self.from_email,
                 "to": self.to_email,
-                "subject": subject,
+                "subject": FIRST_EMAIL_SUBJECT,
                 "timestamp": datetime.now().isoformat(),
                 "smtp_config": {
                     "host": self.smtp_host,
@@ -114,5 +197,18 @@ FastAPI 自動メール送信システム
             }
 
 
-# シングルトンインスタンス
-email_service = EmailService()
\ No newline at end of file
+@cache
+def get_email_service() -> EmailService:
+    """シングルトンインスタンスを取得（初回呼び出し時に生成）"""
+    return EmailService()
+
+
+async def close_email_service() -> None:
+    """シングルトンのSMTP接続を閉じて破棄する（lifespan終了時）
+
+    asyncio.Lock はイベントループごとに作り直す必要があるため、
+    次回の起動では新しいインスタンスが生成されるようキャッシュも消す。
+    """
+    if get_email_service.cache_info().currsize:
+        await get_email_service().aclose()
+        get_email_service.cache_clear()
@@ -1,10 +1,10 @@
+import asyncio
 import os
 import uuid
 import aiofiles
 from PIL import Image
 from fastapi import HTTPException, UploadFile
-from typing import Tuple, Dict, Any
-import magic
+from typing import Tuple, Dict, Any, Optional
 import hashlib
 from pathlib import Path
 import logging
@@ -12,6 +12,55 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Units for human-readable file sizes and their byte divisors
+FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+FILE_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(FILE_SIZE_UNITS)))
+# Leading "magic" bytes of the supported image formats
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+)
+
+
+def _sniff_mime(buf: bytes) -> Optional[str]:
+    """Detect the image MIME type from the file header, or None if unknown"""
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if buf.startswith(signature):
+            return mime_type
+    # WebP: "RIFF" <4-byte size> "WEBP"
+    if buf[0:4] == b'RIFF' and buf[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def _verify_image(file_path: Path) -> None:
+    """Verify that the file is a valid image (blocking, run in a worker thread)"""
+    with Image.open(file_path) as image:
+        image.verify()
+
+
+def _extract_metadata(file_path: Path) -> Dict[str, Any]:
+    """Read image metadata with PIL (blocking, run in a worker thread)"""
+    with Image.open(file_path) as img:
+        metadata = {
+            'width': img.width,
+            'height': img.height,
+            'format': img.format,
+            'mode': img.mode
+        }
+        
+        # Extract EXIF data if available
+        if hasattr(img, '_getexif') and img._getexif():
+            exif_data = img._getexif()
+            metadata['exif'] = {
+                k: v for k, v in exif_data.items() 
+                if isinstance(v, (str, int, float))
+            }
+        
+        return metadata
+
 
 class ImageProcessingService:
     def __init__(self):
@@ -34,41 +83,17 @@ class ImageProcessingService:
         """
         # Validate file size
         if file.size and file.size > self.max_file_size:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size allowed: {self.max_file_size / (1024*1024):.1f}MB"
-            )
-        
-        # Read file content
-        content = await file.read()
-        if len(content) > self.max_file_size:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size allowed: {self.max_file_size / (1024*1024):.1f}MB"
-            )
+            raise self._file_too_large_error()
         
-        # Validate file type using python-magic
-        file_type = magic.from_buffer(content, mime=True)
+        # Validate file type from the header bytes of the upload
+        first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        file_type = _sniff_mime(first_chunk)
         if file_type not in self.allowed_types:
             raise HTTPException(
                 status_code=415,
-                detail=f"Unsupported file type: {file_type}. Allowed types: {', '.join(self.allowed_types)}"
+                detail=f"Unsupported file type: {file_type or 'unknown'}. Allowed types: {', '.join(self.allowed_types)}"
             )
         
-        # Validate that it's actually an image using PIL
-        try:
-            image = Image.open(file.file)
-            image.verify()  # Verify it's a valid image
-        except Exception as e:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid image file: {str(e)}"
-            )
-        
-        # Reset file pointer after verification
-        await file.seek(0)
-        content = await file.read()
-        
         # Generate unique filename
         file_extension = self._get_file_extension(file_type)
         unique_filename = f"{uuid.uuid4()}{file_extension}"
@@ -76,31 +101,58 @@ class ImageProcessingService:
         # Ensure upload directory exists
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save file
+        # Stream the upload to disk, hashing and size-checking each chunk
         file_path = self.upload_dir / unique_filename
+        file_hash = hashlib.md5()
+        file_size = 0
         try:
             async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(content)
+                chunk = first_chunk
+                while chunk:
+                    file_size += len(chunk)
+                    if file_size > self.max_file_size:
+                        raise self._file_too_large_error()
+                    file_hash.update(chunk)
+                    await f.write(chunk)
+                    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        except HTTPException:
+            file_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
             logger.error(f"Error saving file {unique_filename}: {str(e)}")
+            file_path.unlink(missing_ok=True)
             raise HTTPException(status_code=500, detail="Error saving file")
         
+        # Validate that it's actually an image using PIL (off the event loop)
+        try:
+            await asyncio.to_thread(_verify_image, file_path)
+        except Exception as e:
+            file_path.unlink(missing_ok=True)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid image file: {str(e)}"
+            )
+        
         # Get image metadata
         image_info = await self._get_image_metadata(file_path)
         
-        # Calculate file hash for deduplication
-        file_hash = hashlib.md5(content).hexdigest()
-        
         return {
             'filename': file.filename,
             'saved_filename': unique_filename,
             'file_path': str(file_path),
-            'file_size': len(content),
+            'file_size': file_size,
             'content_type': file_type,
-            'file_hash': file_hash,
+            'file_hash': file_hash.hexdigest(),
             'image_info': image_info
         }
     
+    def _file_too_large_error(self) -> HTTPException:
+        """Build the 413 error raised when an upload exceeds the size limit"""
+        return HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size allowed: {self.max_file_size / (1024*1024):.1f}MB"
+        )
+    
     def _get_file_extension(self, mime_type: str) -> str:
         """Get file extension from MIME type"""
         extensions = {
@@ -113,23 +165,7 @@ class ImageProcessingService:
     async def _get_image_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract metadata from image file"""
         try:
-            with Image.open(file_path) as img:
-                metadata = {
-                    'width': img.width,
-                    'height': img.height,
-                    'format': img.format,
-                    'mode': img.mode
-                }
-                
-                # Extract EXIF data if available
-                if hasattr(img, '_getexif') and img._getexif():
-                    exif_data = img._getexif()
-                    metadata['exif'] = {
-                        k: v for k, v in exif_data.items() 
-                        if isinstance(v, (str, int, float))
-                    }
-                
-                return metadata
+            return await asyncio.to_thread(_extract_metadata, file_path)
         except Exception as e:
             logger.warning(f"Could not extract metadata from {file_path}: {str(e)}")
             return {}
@@ -157,11 +193,9 @@ class ImageProcessingService:
     
     def get_file_size_formatted(self, size_bytes: int) -> str:
         """Format file size in human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Each unit is 2**10 times the previous one, so the bit length picks the unit
+        unit_index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(FILE_SIZE_UNITS) - 1)
+        return f"{size_bytes / FILE_SIZE_DIVISORS[unit_index]:.1f} {FILE_SIZE_UNITS[unit_index]}"
     
     async def validate_image_security(self, file_path: Path) -> bool:
         """
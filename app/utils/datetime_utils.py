@@ -1,9 +1,14 @@
+import math
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Optional
 
 # 日本標準時（JST）の設定
 JST = timezone(timedelta(hours=9))
 
+# 標準の表示フォーマット（秒単位）
+JST_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 def get_jst_now() -> datetime:
     """現在の日本時間を取得"""
@@ -22,16 +27,28 @@ def to_jst(dt: Optional[datetime]) -> Optional[datetime]:
     return dt.astimezone(JST)
 
 
-def format_jst(dt: Optional[datetime], format_str: str = "%Y-%m-%d %H:%M:%S") -> Optional[str]:
+@lru_cache(maxsize=4096)
+def _format_jst_seconds(timestamp: int) -> str:
+    """UNIX秒を標準フォーマットの日本時間文字列に変換（秒単位でキャッシュ）"""
+    return datetime.fromtimestamp(timestamp, JST).strftime(JST_FORMAT)
+
+
+def format_jst(dt: Optional[datetime], format_str: str = JST_FORMAT) -> Optional[str]:
     """日本時間として整形した文字列を返す"""
     if dt is None:
         return None
     
+    # 標準フォーマットは秒精度なので、同じ秒の日時は整形結果を使い回す
+    if format_str == JST_FORMAT:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return _format_jst_seconds(math.floor(dt.timestamp()))
+    
     jst_dt = to_jst(dt)
     return jst_dt.strftime(format_str) if jst_dt else None
 
 
-def parse_jst(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> datetime:
+def parse_jst(date_str: str, format_str: str = JST_FORMAT) -> datetime:
     """日本時間の文字列をdatetimeに変換"""
     dt = datetime.strptime(date_str, format_str)
     return dt.replace(tzinfo=JST)
\ No newline at end of file
@@ -1,125 +1,360 @@
 """
 Database inspection script to discover existing tables and their structure.
 """
+import asyncio
+import hashlib
+import io
+import pickle
 import sys
-from sqlalchemy import inspect, MetaData, text
-from sqlalchemy.orm import Session
-from app.core.database import sync_engine
+from contextlib import closing, redirect_stdout
+from pathlib import Path
+import asyncpg
+from sqlalchemy import inspect
+from app.core.database import engine, sync_engine
 from app.core.config import settings
-import json
 
 
-def inspect_database():
-    """Inspect the database and print all tables and their structure."""
+# Upper bound on concurrent connections used for sample/count queries
+MAX_SAMPLE_CONNECTIONS = 16
+
+# Connect arguments SQLAlchemy's asyncpg dialect consumes itself; asyncpg.connect() rejects them
+_DIALECT_ONLY_CONNECT_ARGS = (
+    "async_fallback",
+    "async_creator_fn",
+    "prepared_statement_cache_size",
+    "prepared_statement_name_func",
+)
+
+# Rows fetched per round trip when streaming a whole table
+STREAM_CHUNK_SIZE = 1000
+
+# Schemas, tables and views of the default schema, and public enum types, as jsonb arrays
+CATALOG_OVERVIEW_SQL = """
+    WITH schemas AS (
+        SELECT coalesce(jsonb_agg(nspname ORDER BY nspname), '[]'::jsonb) AS names
+        FROM pg_namespace
+        WHERE nspname !~ '^pg_'
+    ), tables AS (
+        SELECT coalesce(jsonb_agg(c.relname ORDER BY c.relname), '[]'::jsonb) AS names
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+    ), views AS (
+        SELECT coalesce(jsonb_agg(c.relname ORDER BY c.relname), '[]'::jsonb) AS names
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relkind = 'v'
+    ), enums AS (
+        SELECT coalesce(jsonb_agg(jsonb_build_array(t.typname, labels.enum_values) ORDER BY t.typname), '[]'::jsonb) AS types
+        FROM pg_type t
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        CROSS JOIN LATERAL (
+            SELECT jsonb_agg(e.enumlabel ORDER BY e.enumsortorder) AS enum_values
+            FROM pg_enum e
+            WHERE e.enumtypid = t.oid
+        ) labels
+        WHERE t.typtype = 'e' AND n.nspname = 'public'
+    )
+    SELECT schemas.names, tables.names, views.names, enums.types
+    FROM schemas, tables, views, enums
+"""
+
+SCHEMA_CACHE_DIR = Path.home() / ".cache" / "first_fastapi2"
+
+# In-process copy of the reflected structure: cache file path -> (catalog_version, tables)
+_schema_memo = {}
+
+# Changes whenever a relation of the current schema, or one of its columns, column
+# defaults or constraints, is created, dropped or altered. ALTER TABLE ... ADD COLUMN /
+# SET DEFAULT / ADD CONSTRAINT only touch pg_attribute / pg_attrdef / pg_constraint,
+# so the xmins of those rows are hashed together with the pg_class ones.
+CATALOG_VERSION_SQL = """
+    WITH rels AS (
+        SELECT c.oid, c.xmin
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema()
+    )
+    SELECT md5(string_agg(part, ',' ORDER BY part))
+    FROM (
+        SELECT 'c' || rels.oid || ':' || rels.xmin
+        FROM rels
+        UNION ALL
+        SELECT 'a' || a.attrelid || '.' || a.attnum || ':' || a.xmin
+        FROM pg_attribute a
+        JOIN rels ON rels.oid = a.attrelid
+        WHERE a.attnum > 0
+        UNION ALL
+        SELECT 'd' || d.oid || ':' || d.xmin
+        FROM pg_attrdef d
+        JOIN rels ON rels.oid = d.adrelid
+        UNION ALL
+        SELECT 'k' || k.oid || ':' || k.xmin
+        FROM pg_constraint k
+        JOIN rels ON rels.oid = k.conrelid
+    ) parts(part)
+"""
+
+
+# One report line per column: name, type, nullability and default
+COLUMN_LINE = "  - {name}: {type} {nullable} {default}"
+
+
+def _format_column(col):
+    """Render one reflected column as a report line."""
+    return COLUMN_LINE.format(
+        name=col['name'],
+        type=col['type'],
+        nullable="NULL" if col['nullable'] else "NOT NULL",
+        default=f"DEFAULT {col['default']}" if col.get('default') else "",
+    )
+
+
+def _reflect_tables(inspector, table_names):
+    """Reflect columns, primary keys, foreign keys and indexes of every table."""
+    # One catalog query per category (instead of 4 per table);
+    # results are keyed by (schema, table) where None is the default schema
+    all_columns = inspector.get_multi_columns()
+    all_pks = inspector.get_multi_pk_constraint()
+    all_fks = inspector.get_multi_foreign_keys()
+    all_indexes = inspector.get_multi_indexes()
+    
+    return {
+        table_name: {
+            # Store the type as its SQL string so the result pickles cleanly
+            'columns': [{**col, 'type': str(col['type'])} for col in all_columns[(None, table_name)]],
+            'pk': all_pks[(None, table_name)],
+            'fks': all_fks[(None, table_name)],
+            'indexes': all_indexes[(None, table_name)],
+        }
+        for table_name in table_names
+    }
+
+
+def _schema_cache_path(server_version):
+    """Cache file for the configured database and server version."""
+    cache_key = f"{settings.DATABASE_URL_SYNC}|{server_version}"
+    digest = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
+    return SCHEMA_CACHE_DIR / f"schema_{digest}.pkl"
+
+
+def load_table_schema(conn, inspector, table_names, refresh=False):
+    """Return the reflected table structure, reusing the on-disk cache when it is still valid."""
+    server_version = conn.exec_driver_sql("SHOW server_version").scalar()
+    catalog_version = conn.exec_driver_sql(CATALOG_VERSION_SQL).scalar()
+    
+    cache_path = _schema_cache_path(server_version)
+    if refresh:
+        _schema_memo.clear()
+    
+    # Repeated calls in the same process skip both reflection and unpickling
+    memo = _schema_memo.get(cache_path)
+    if memo and memo[0] == catalog_version and set(memo[1]) == set(table_names):
+        return memo[1]
+    
+    if not refresh and cache_path.exists():
+        try:
+            with cache_path.open("rb") as f:
+                cached = pickle.load(f)
+            if cached["catalog_version"] == catalog_version and set(cached["tables"]) == set(table_names):
+                _schema_memo[cache_path] = (catalog_version, cached["tables"])
+                return cached["tables"]
+        except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+            pass  # Unreadable cache: reflect again and overwrite it
+    
+    tables = _reflect_tables(inspector, table_names)
+    _schema_memo[cache_path] = (catalog_version, tables)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump({"catalog_version": catalog_version, "tables": tables}, f)
+    except OSError:
+        pass  # Caching is best-effort (e.g. read-only home directory)
+    return tables
+
+
+def stream_table_rows(table_name, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield every row of a table in chunks of chunk_size.
+
+    Uses a server-side cursor (stream_results) so a full-table dump never
+    buffers the whole result on the client. Connection.execution_options()
+    mutates the connection in place, so the helper streams on a connection
+    of its own instead of the shared inspection connection.
+    """
+    with sync_engine.connect() as conn:
+        streaming_conn = conn.execution_options(stream_results=True, yield_per=chunk_size)
+        result = streaming_conn.exec_driver_sql(f'SELECT * FROM "{table_name}"')
+        for partition in result.partitions():
+            yield from partition
+
+
+def dump_table(table_name):
+    """Print every row of one table (--dump TABLE on the command line)."""
+    for row in stream_table_rows(table_name):
+        print(tuple(row))
+
+
+def _build_sample_statements(table_names):
+    """Build the sample and count SQL of every table once, up front."""
+    # Table names cannot be bind parameters, so each table gets its own literal statement
+    return {
+        table_name: (
+            f'SELECT * FROM "{table_name}" LIMIT 5',
+            f'SELECT COUNT(*) FROM "{table_name}"',
+        )
+        for table_name in table_names
+    }
+
+
+async def _fetch_table_sample(pool, sample_sql, count_sql):
+    """Fetch the first 5 rows and the total row count of one table."""
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(sample_sql)
+        count = await conn.fetchval(count_sql)
+    return rows, count
+
+
+async def fetch_table_samples(table_names):
+    """Fetch sample rows and row counts for all tables concurrently over asyncpg."""
+    if not table_names:
+        return {}
+    
+    # Let the app's async dialect translate DATABASE_URL (ssl=require etc.) into asyncpg
+    # keyword arguments, so the pool connects exactly like the API's own engine
+    _, connect_args = engine.dialect.create_connect_args(engine.url)
+    for key in _DIALECT_ONLY_CONNECT_ARGS:
+        connect_args.pop(key, None)
+    
+    statements = _build_sample_statements(table_names)
+    pool_size = min(len(table_names), MAX_SAMPLE_CONNECTIONS)
+    async with asyncpg.create_pool(**connect_args, min_size=1, max_size=pool_size) as pool:
+        results = await asyncio.gather(*(
+            _fetch_table_sample(pool, sample_sql, count_sql)
+            for sample_sql, count_sql in statements.values()
+        ))
+    return dict(zip(table_names, results))
+
+
+def inspect_database(refresh=False):
+    """Inspect the database and print all tables and their structure.
+    
+    Table structure is cached under ~/.cache/first_fastapi2; pass refresh=True
+    (or --refresh on the command line) to force a fresh reflection.
+    """
     
     print(f"Connecting to database: {settings.DATABASE_NAME}")
     print("=" * 80)
     
+    # The report is hundreds of short lines: collect them and write once
+    output = io.StringIO()
     try:
-        # Create inspector
-        inspector = inspect(sync_engine)
+        # One connection for every catalog query below
+        with sync_engine.connect() as conn, redirect_stdout(output):
+            _inspect_with_connection(conn, refresh)
+    except Exception as e:
+        sys.stdout.write(output.getvalue())
+        print(f"Error inspecting database: {e}")
+        print(f"Make sure DATABASE_URL_SYNC and DATABASE_URL in .env are correctly configured.")
+        print(f"Current DATABASE_URL_SYNC: {settings.DATABASE_URL_SYNC[:50]}...")
+        print(f"Current DATABASE_URL: {settings.DATABASE_URL[:50]}...")
+        sys.exit(1)
+    
+    sys.stdout.write(output.getvalue())
+    print("\n" + "=" * 80)
+    print("Database inspection complete!")
+
+
+def _inspect_with_connection(conn, refresh):
+    """Print the database structure using a single checked-out connection."""
+    # Create inspector bound to the same connection
+    inspector = inspect(conn)
+    
+    # Get schema, table, view and enum names in a single round trip
+    with closing(conn.connection.cursor()) as cursor:
+        cursor.execute(CATALOG_OVERVIEW_SQL)
+        schemas, table_names, view_names, enums = cursor.fetchone()
+    
+    # Print all schema names
+    print(f"\nAvailable schemas: {schemas}")
+    print("=" * 80)
+    
+    # Print all table names (default schema)
+    print(f"\nTables in 'public' schema: {table_names}")
+    print("=" * 80)
+    
+    # Reflect columns / keys / indexes (cached on disk while the catalog is unchanged)
+    table_schema = load_table_schema(conn, inspector, table_names, refresh=refresh)
+    
+    # Sample rows and counts are independent per table, so fetch them all at once
+    table_samples = asyncio.run(fetch_table_samples(table_names))
+    
+    # For each table, get detailed information
+    for table_name in table_names:
+        print(f"\n\nTable: {table_name}")
+        print("-" * 40)
         
-        # Get all schema names
-        schemas = inspector.get_schema_names()
-        print(f"\nAvailable schemas: {schemas}")
-        print("=" * 80)
+        table_info = table_schema[table_name]
         
-        # Get all table names (default schema)
-        table_names = inspector.get_table_names()
-        print(f"\nTables in 'public' schema: {table_names}")
-        print("=" * 80)
+        # Get columns
+        columns = table_info['columns']
+        print("\nColumns:")
+        print("\n".join(map(_format_column, columns)))
         
-        # For each table, get detailed information
-        for table_name in table_names:
-            print(f"\n\nTable: {table_name}")
-            print("-" * 40)
-            
-            # Get columns
-            columns = inspector.get_columns(table_name)
-            print("\nColumns:")
-            for col in columns:
-                col_type = str(col['type'])
-                nullable = "NULL" if col['nullable'] else "NOT NULL"
-                default = f"DEFAULT {col['default']}" if col.get('default') else ""
-                print(f"  - {col['name']}: {col_type} {nullable} {default}")
-            
-            # Get primary keys
-            pk = inspector.get_pk_constraint(table_name)
-            if pk['constrained_columns']:
-                print(f"\nPrimary Key: {pk['constrained_columns']}")
-            
-            # Get foreign keys
-            fks = inspector.get_foreign_keys(table_name)
-            if fks:
-                print("\nForeign Keys:")
-                for fk in fks:
-                    print(f"  - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-            
-            # Get indexes
-            indexes = inspector.get_indexes(table_name)
-            if indexes:
-                print("\nIndexes:")
-                for idx in indexes:
-                    unique = "UNIQUE" if idx['unique'] else ""
-                    print(f"  - {idx['name']}: {idx['column_names']} {unique}")
-            
-            # Get sample data (first 5 rows)
-            with sync_engine.connect() as conn:
-                result = conn.execute(text(f'SELECT * FROM "{table_name}" LIMIT 5'))
-                rows = result.fetchall()
-                if rows:
-                    print(f"\nSample data (first {len(rows)} rows):")
-                    # Get column names
-                    col_names = result.keys()
-                    print(f"  Columns: {list(col_names)}")
-                    for i, row in enumerate(rows, 1):
-                        print(f"  Row {i}: {dict(row._mapping)}")
-                
-                # Get row count
-                count_result = conn.execute(text(f'SELECT COUNT(*) as count FROM "{table_name}"'))
-                count = count_result.scalar()
-                print(f"\nTotal rows: {count}")
+        # Get primary keys
+        pk = table_info['pk']
+        if pk['constrained_columns']:
+            print(f"\nPrimary Key: {pk['constrained_columns']}")
         
-        # Also check for views
-        view_names = inspector.get_view_names()
-        if view_names:
-            print("\n" + "=" * 80)
-            print(f"Views in 'public' schema: {view_names}")
-            for view_name in view_names:
-                print(f"\nView: {view_name}")
-                columns = inspector.get_columns(view_name)
-                for col in columns:
-                    print(f"  - {col['name']}: {str(col['type'])}")
+        # Get foreign keys
+        fks = table_info['fks']
+        if fks:
+            print("\nForeign Keys:")
+            for fk in fks:
+                print(f"  - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
         
-        # Check for custom types/enums
-        with sync_engine.connect() as conn:
-            result = conn.execute(text("""
-                SELECT n.nspname as schema, t.typname as type_name, 
-                       array_agg(e.enumlabel ORDER BY e.enumsortorder) as enum_values
-                FROM pg_type t 
-                JOIN pg_namespace n ON n.oid = t.typnamespace 
-                LEFT JOIN pg_enum e ON e.enumtypid = t.oid
-                WHERE t.typtype = 'e' AND n.nspname = 'public'
-                GROUP BY n.nspname, t.typname
-            """))
-            enums = result.fetchall()
-            if enums:
-                print("\n" + "=" * 80)
-                print("Custom ENUM types:")
-                for enum in enums:
-                    print(f"  - {enum.type_name}: {enum.enum_values}")
+        # Get indexes
+        indexes = table_info['indexes']
+        if indexes:
+            print("\nIndexes:")
+            for idx in indexes:
+                unique = "UNIQUE" if idx['unique'] else ""
+                print(f"  - {idx['name']}: {idx['column_names']} {unique}")
         
-        print("\n" + "=" * 80)
-        print("Database inspection complete!")
+        # Print sample data (first 5 rows) fetched concurrently above
+        rows, count = table_samples[table_name]
+        if rows:
+            print(f"\nSample data (first {len(rows)} rows):")
+            # Get column names
+            col_names = list(rows[0].keys())
+            print(f"  Columns: {col_names}")
+            for i, row in enumerate(rows, 1):
+                print(f"  Row {i}: {dict(row)}")
         
-    except Exception as e:
-        print(f"Error inspecting database: {e}")
-        print(f"Make sure your DATABASE_URL_SYNC in .env is correctly configured.")
-        print(f"Current DATABASE_URL_SYNC: {settings.DATABASE_URL_SYNC[:50]}...")
-        sys.exit(1)
+        # Print row count
+        print(f"\nTotal rows: {count}")
+    
+    # Also check for views
+    if view_names:
+        print("\n" + "=" * 80)
+        print(f"Views in 'public' schema: {view_names}")
+        for view_name in view_names:
+            print(f"\nView: {view_name}")
+            columns = inspector.get_columns(view_name)
+            for col in columns:
+                print(f"  - {col['name']}: {str(col['type'])}")
+    
+    # Check for custom types/enums
+    if enums:
+        print("\n" + "=" * 80)
+        print("Custom ENUM types:")
+        for type_name, enum_values in enums:
+            print(f"  - {type_name}: {enum_values}")
 
 
 if __name__ == "__main__":
-    print("Starting database inspection...")
     print("Please make sure you have configured your .env file with the correct database credentials.")
-    inspect_database()
\ No newline at end of file
+    if "--dump" in sys.argv[:-1]:
+        dump_table(sys.argv[sys.argv.index("--dump") + 1])
+    else:
+        print("Starting database inspection...")
+        inspect_database(refresh="--refresh" in sys.argv)
\ No newline at end of file
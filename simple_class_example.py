@@ -4,17 +4,22 @@ Pythonクラスの基本例
 
 # 1. シンプルなクラス
 class Dog:
+    # インスタンス変数を固定（__dict__ を持たないので省メモリ・属性アクセスも高速）
+    __slots__ = ("name", "age", "breed")
+
     # クラス変数（全インスタンス共通）
     species = "イヌ"
     total_dogs = 0
 
-    def __init__(self, name, age, breed="雑種"):
+    def __init__(self, name, age, breed="雑種", verbose=True):
         # インスタンス変数（各犬固有）
         self.name = name
         self.age = age
         self.breed = breed
         Dog.total_dogs += 1
-        print(f"{name}が生まれました！")
+        # 大量に生成する場合は verbose=False で出力を省略
+        if verbose:
+            print(f"{name}が生まれました！")
 
     def bark(self):
         return f"{self.name}がワンワン！"
@@ -1,9 +1,41 @@
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock
+from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
 @pytest.fixture
 def mock_db_session():
     """モックのデータベースセッション"""
     session = AsyncMock(spec=AsyncSession)
-    return session
\ No newline at end of file
+    return session
+
+
+@pytest.fixture(scope="session")
+def client():
+    """アプリ本体のTestClient（セッション全体で1つを共有し、起動処理も1回だけ）"""
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def pop_1990(client):
+    """1990年・400万人超の人口データ（セッション中に1回だけ取得）"""
+    response = client.get("/api/v1/population/1990/over4million")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def pop_1980_2000(client):
+    """1980〜2000年・200万人超の人口データ（セッション中に1回だけ取得）"""
+    response = client.get("/api/v1/population/1980_2000/over2million")
+    assert response.status_code == 200
+    return response.json()
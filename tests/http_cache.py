@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+HTTPレスポンスの記録・再生キャッシュ
+VCR_MODE=cache のとき、結果が決定的なリクエストのレスポンスを tests/fixtures/ に保存し、
+2回目以降はサーバーにアクセスせず保存済みのレスポンスを返します。
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import httpx
+import orjson
+
+VCR_MODE = os.getenv("VCR_MODE", "")
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 保存済みの本文（デコード済み）と合わなくなるヘッダーは記録しない
+_SKIPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection"}
+
+
+def cache_key(request: httpx.Request) -> str:
+    """(メソッド, パス, ソート済みクエリ, ボディ) からキャッシュキーを生成"""
+    key = orjson.dumps([
+        request.method,
+        request.url.path,
+        sorted(request.url.params.multi_items()),
+        request.content.decode("utf-8", errors="replace"),
+    ])
+    return hashlib.sha256(key).hexdigest()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """ヒット時は保存済みレスポンスを返し、ミス時は実サーバーの結果を書き戻すトランスポート"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache_dir: Path = FIXTURES_DIR):
+        self._transport = transport
+        self._cache_dir = cache_dir
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # リダイレクト先へのリクエストは本文がストリームのままなので先に読み込む
+        await request.aread()
+        cache_path = self._cache_dir / f"{cache_key(request)}.json"
+        if cache_path.exists():
+            cached = orjson.loads(cache_path.read_bytes())
+            return httpx.Response(
+                cached["status_code"],
+                headers=cached["headers"],
+                content=cached["content"].encode("utf-8"),
+                request=request,
+            )
+
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        # リダイレクトの Location なども再生できるようにヘッダーごと保存
+        headers = [
+            [name, value] for name, value in response.headers.items()
+            if name.lower() not in _SKIPPED_HEADERS
+        ]
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(orjson.dumps({
+            "method": request.method,
+            "url": str(request.url),
+            "status_code": response.status_code,
+            "headers": headers,
+            "content": content.decode("utf-8", errors="replace"),
+        }, option=orjson.OPT_INDENT_2))
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
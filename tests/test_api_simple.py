@@ -9,18 +9,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
-from fastapi.testclient import TestClient
 
-# FastAPIアプリケーションをインポート
-from app.main import app
-
-# TestClientの作成
-client = TestClient(app)
+# TestClient は conftest.py のセッション共有フィクスチャ client を使用
 
 class TestBasicEndpoints:
     """基本的なエンドポイントのテスト"""
     
-    def test_root_endpoint(self):
+    def test_root_endpoint(self, client):
         """ルートエンドポイントのテスト"""
         response = client.get("/")
         assert response.status_code == 200
@@ -29,7 +24,7 @@ class TestBasicEndpoints:
         assert "project" in data
         assert data["project"] == "First FastAPI with Neon"
         
-    def test_health_check(self):
+    def test_health_check(self, client):
         """ヘルスチェックエンドポイントのテスト"""
         response = client.get("/health")
         assert response.status_code == 200
@@ -37,12 +32,12 @@ class TestBasicEndpoints:
         assert data["status"] == "healthy"
         assert "message" in data
         
-    def test_invalid_endpoint(self):
+    def test_invalid_endpoint(self, client):
         """存在しないエンドポイントのテスト"""
         response = client.get("/api/v1/invalid")
         assert response.status_code == 404
         
-    def test_cors_headers(self):
+    def test_cors_headers(self, client):
         """CORSヘッダーのテスト"""
         # CORSヘッダーは実際のクロスオリジンリクエストでのみ設定される
         response = client.get("/", headers={"Origin": "http://localhost:3000"})
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""AzureVisionService のバッチ解析テスト（Azure APIはモック）"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.azure_vision import AzureVisionService
+
+
+@pytest.fixture
+def service():
+    """APIキー不要でモッククライアントを使うサービス"""
+    service = AzureVisionService.__new__(AzureVisionService)
+    service.client = MagicMock()
+    return service
+
+
+@pytest.mark.fast
+async def test_analyze_images_bounds_concurrency_and_keeps_order(service, monkeypatch):
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def fake_analyze(image_path):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return {"path": image_path}
+
+    monkeypatch.setattr(service, "_analyze_image_sync", fake_analyze)
+    paths = [f"image_{i}.png" for i in range(6)]
+
+    results = await service.analyze_images(paths, max_concurrency=2)
+
+    assert results == [{"path": path} for path in paths]
+    assert max_in_flight == 2
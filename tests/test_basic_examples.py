@@ -23,20 +23,23 @@ def read_item(item_id: int):
 def create_item(item: dict):
     return {"status": "created", "item": item}
 
-# TestClientを作成
-client = TestClient(test_app)
+# TestClientを作成（このファイル専用のアプリなので conftest.py の client を上書き）
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(test_app) as test_client:
+        yield test_client
 
 # =====================================
 # pytestで自動実行されるテスト関数
 # =====================================
 
-def test_read_root():
+def test_read_root(client):
     """ルートエンドポイントのテスト"""
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Hello pytest"}
 
-def test_read_item():
+def test_read_item(client):
     """アイテム取得のテスト"""
     response = client.get("/items/42")
     assert response.status_code == 200
@@ -44,7 +47,7 @@ def test_read_item():
     assert json_data["item_id"] == 42
     assert json_data["name"] == "Item 42"
 
-def test_create_item():
+def test_create_item(client):
     """アイテム作成のテスト"""
     test_data = {"name": "Test Item", "price": 100}
     response = client.post("/items", json=test_data)
@@ -53,7 +56,7 @@ def test_create_item():
     assert json_data["status"] == "created"
     assert json_data["item"] == test_data
 
-def test_invalid_item_id():
+def test_invalid_item_id(client):
     """無効なアイテムIDのテスト"""
     response = client.get("/items/invalid")
     assert response.status_code == 422  # Validation error
@@ -67,7 +70,7 @@ def test_invalid_item_id():
     (100, "Item 100"),
     (999, "Item 999"),
 ])
-def test_multiple_items(item_id, expected_name):
+def test_multiple_items(client, item_id, expected_name):
     """複数のアイテムIDをテスト（パラメータ化）"""
     response = client.get(f"/items/{item_id}")
     assert response.status_code == 200
@@ -78,13 +81,13 @@ def test_multiple_items(item_id, expected_name):
 # =====================================
 
 @pytest.mark.fast
-def test_fast_operation():
+def test_fast_operation(client):
     """高速テスト（マーカー付き）"""
     response = client.get("/")
     assert response.status_code == 200
 
 @pytest.mark.slow
-def test_slow_operation():
+def test_slow_operation(client):
     """低速テスト（マーカー付き）"""
     # 実際には時間のかかる処理をシミュレート
     import time
@@ -105,7 +108,7 @@ def sample_data():
         "quantity": 5
     }
 
-def test_with_fixture_data(sample_data):
+def test_with_fixture_data(client, sample_data):
     """フィクスチャを使ったテスト"""
     response = client.post("/items", json=sample_data)
     assert response.status_code == 200
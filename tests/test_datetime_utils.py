@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""日本時間ユーティリティのテスト"""
+
+import sys
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.datetime_utils import JST, format_jst
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("dt,expected", [
+    # timezone-naiveな値はUTCとして扱う
+    (datetime(2024, 1, 1, 0, 0, 0, 999999), "2024-01-01 09:00:00"),
+    (datetime(2024, 1, 1, 15, 30, 0, tzinfo=timezone.utc), "2024-01-02 00:30:00"),
+    (datetime(2024, 1, 1, 12, 0, 0, tzinfo=JST), "2024-01-01 12:00:00"),
+    (datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc), "1970-01-01 08:59:59"),
+])
+def test_format_jst_default_format(dt, expected):
+    assert format_jst(dt) == expected
+
+
+@pytest.mark.fast
+def test_format_jst_custom_format_and_none():
+    dt = datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone(timedelta(hours=-5)))
+    assert format_jst(dt, "%Y/%m/%d %H:%M:%S.%f") == "2024/01/01 14:00:00.123456"
+    assert format_jst(None) is None
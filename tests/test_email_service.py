@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""EmailService のテスト（SMTPはモック）"""
+
+import sys
+from email import message_from_bytes
+from email.header import decode_header, make_header
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services.email_service import (
+    FIRST_EMAIL_SUBJECT,
+    EmailService,
+    close_email_service,
+    get_email_service,
+)
+
+
+@pytest.fixture
+def smtp_class():
+    """smtplib.SMTP をモックに差し替え"""
+    with patch("app.services.email_service.smtplib.SMTP") as smtp_class:
+        smtp_class.return_value.noop.return_value = (250, b"OK")
+        yield smtp_class
+
+
+@pytest.mark.fast
+async def test_send_first_email_reuses_connection(smtp_class):
+    service = EmailService()
+
+    first = await service.send_first_email()
+    second = await service.send_first_email()
+
+    assert first["status"] == "success"
+    assert second["status"] == "success"
+    # 接続・認証は1回だけで、送信は2回
+    assert smtp_class.call_count == 1
+    assert smtp_class.return_value.login.call_count == 1
+    assert smtp_class.return_value.sendmail.call_count == 2
+
+
+@pytest.mark.fast
+async def test_send_first_email_reconnects_after_failure(smtp_class):
+    service = EmailService()
+    broken = MagicMock()
+    broken.sendmail.side_effect = OSError("connection reset")
+    healthy = MagicMock()
+    healthy.noop.return_value = (250, b"OK")
+    smtp_class.side_effect = [broken, healthy]
+
+    failed = await service.send_first_email()
+    recovered = await service.send_first_email()
+
+    assert failed["status"] == "error"
+    assert recovered["status"] == "success"
+    broken.close.assert_called_once()
+    assert smtp_class.call_count == 2
+
+
+@pytest.mark.fast
+async def test_send_first_email_message_format(smtp_class):
+    service = EmailService()
+
+    await service.send_first_email()
+
+    from_email, to_email, raw_message = smtp_class.return_value.sendmail.call_args.args
+    message = message_from_bytes(raw_message)
+    assert str(make_header(decode_header(message["Subject"]))) == FIRST_EMAIL_SUBJECT
+    assert message["From"] == from_email
+    assert message["To"] == to_email
+    body = message.get_payload(decode=True).decode(message.get_content_charset())
+    assert "FastAPI からの自動送信メールです。" in body
+    assert f"受信者: {to_email}" in body
+
+
+@pytest.mark.fast
+async def test_send_first_email_encodes_non_ascii_names(smtp_class, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_FROM", "山田 太郎 <from@example.com>")
+    monkeypatch.setattr(settings, "EMAIL_TO", "佐藤 花子 <to@example.com>")
+    service = EmailService()
+
+    result = await service.send_first_email()
+
+    assert result["status"] == "success"
+    raw_message = smtp_class.return_value.sendmail.call_args.args[2]
+    message = message_from_bytes(raw_message)
+    assert str(make_header(decode_header(message["From"]))) == "山田 太郎 <from@example.com>"
+    assert str(make_header(decode_header(message["To"]))) == "佐藤 花子 <to@example.com>"
+
+
+@pytest.mark.fast
+async def test_close_email_service_quits_and_resets_singleton(smtp_class):
+    service = get_email_service()
+    await service.send_first_email()
+
+    await close_email_service()
+
+    smtp_class.return_value.quit.assert_called_once()
+    assert service._smtp is None
+    # 次の起動（新しいイベントループ）では新しいインスタンスを使う
+    assert get_email_service() is not service
+    get_email_service.cache_clear()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""tests/http_cache.py の CachingTransport テスト（実サーバーの代わりに MockTransport を使用）"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.http_cache import CachingTransport, cache_key
+
+BASE_URL = "http://testserver"
+
+
+@pytest.fixture
+def inner_calls():
+    """内側のトランスポートが受け取ったリクエスト"""
+    return []
+
+
+@pytest.fixture
+def cached_client(tmp_path, inner_calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        inner_calls.append(request)
+        return httpx.Response(200, json={"path": request.url.path}, headers={"x-served-by": "inner"})
+
+    transport = CachingTransport(httpx.MockTransport(handler), cache_dir=tmp_path)
+    return httpx.AsyncClient(base_url=BASE_URL, transport=transport)
+
+
+@pytest.mark.fast
+async def test_miss_records_response(cached_client, inner_calls, tmp_path):
+    async with cached_client:
+        response = await cached_client.get("/api/v1/todos", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"path": "/api/v1/todos"}
+    assert len(inner_calls) == 1
+    assert [path.name for path in tmp_path.iterdir()] == [f"{cache_key(inner_calls[0])}.json"]
+
+
+@pytest.mark.fast
+async def test_hit_replays_without_inner_transport(cached_client, inner_calls):
+    async with cached_client:
+        first = await cached_client.get("/api/v1/todos", params={"limit": 2})
+        second = await cached_client.get("/api/v1/todos", params={"limit": 2})
+
+    assert len(inner_calls) == 1
+    assert second.status_code == first.status_code
+    assert second.content == first.content
+    assert second.headers["x-served-by"] == "inner"
+
+
+@pytest.mark.fast
+def test_cache_key_distinguishes_body_and_query_params():
+    def key(method, url, **kwargs):
+        return cache_key(httpx.Request(method, f"{BASE_URL}{url}", **kwargs))
+
+    # ボディが異なれば別のキー
+    assert key("POST", "/api/v1/todos", json={"title": "a"}) != key("POST", "/api/v1/todos", json={"title": "b"})
+    # クエリパラメータが異なれば別のキー
+    assert key("GET", "/api/v1/todos", params={"limit": 2}) != key("GET", "/api/v1/todos", params={"limit": 3})
+    assert key("GET", "/api/v1/todos", params={"limit": 2}) != key("GET", "/api/v1/todos")
+    # パラメータの順序だけが違う場合は同じキー
+    assert key("GET", "/api/v1/todos?limit=2&completed=false") == key("GET", "/api/v1/todos?completed=false&limit=2")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""画像解析API（POST /api/v1/images/analyze）のテスト（Azure・ファイル保存・DBはモック）"""
+
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api import image_analysis
+from app.core.database import get_db
+
+ANALYZE_URL = "/api/v1/images/analyze"
+FILE_INFO = {
+    "filename": "sample.png",
+    "file_path": "uploads/sample.png",
+    "file_size": 123,
+    "content_type": "image/png",
+}
+
+# SDKのmsrestモデルは未設定の属性がすべてNoneになる
+ANALYSIS_WITH_NONES = {
+    "tags": [{"name": "cat", "confidence": None}],
+    "categories": [{"name": "animal_", "score": None}],
+    "color": {
+        "dominant_color_foreground": None,
+        "dominant_color_background": None,
+        "dominant_colors": None,
+        "accent_color": None,
+        "is_bw_img": None,
+    },
+    "objects": [{"object_property": None, "confidence": None, "rectangle": {"x": 0, "y": 0, "w": 1, "h": 1}}],
+    "brands": [{"name": None, "confidence": None, "rectangle": None}],
+    "faces": [{"age": 3}],
+}
+OCR_WITH_NONES = {"status": None, "text_results": [{"text": None, "bounding_box": None}]}
+
+
+@pytest.fixture
+def analyze_env(client, mock_db_session, monkeypatch):
+    """Azureサービス・ファイル保存・DBセッションを差し替える"""
+    vision = AsyncMock()
+    monkeypatch.setattr(image_analysis, "get_azure_vision_service", lambda: vision)
+    monkeypatch.setattr(
+        image_analysis.image_processing_service,
+        "validate_and_save_image",
+        AsyncMock(return_value=dict(FILE_INFO)),
+    )
+    delete_image_file = AsyncMock()
+    monkeypatch.setattr(image_analysis.image_processing_service, "delete_image_file", delete_image_file)
+
+    async def refresh(obj):
+        obj.id = uuid.uuid4()
+        obj.created_at = obj.updated_at = datetime.now()
+
+    mock_db_session.refresh.side_effect = refresh
+    client.app.dependency_overrides[get_db] = lambda: mock_db_session
+    yield vision, mock_db_session, delete_image_file
+    client.app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.mark.fast
+def test_analyze_accepts_none_values_from_sdk(client, analyze_env):
+    vision, session, delete_image_file = analyze_env
+    vision.analyze_image.return_value = dict(ANALYSIS_WITH_NONES)
+    vision.analyze_image_with_text.return_value = dict(OCR_WITH_NONES)
+
+    response = client.post(ANALYZE_URL, files={"file": ("sample.png", b"png", "image/png")})
+
+    assert response.status_code == 200
+    session.commit.assert_awaited_once()
+    delete_image_file.assert_not_awaited()
+
+    analysis = response.json()["azure_analysis"]
+    assert analysis["tags"] == [{"name": "cat", "confidence": None}]
+    assert analysis["color"]["dominant_colors"] == []
+    assert analysis["objects"][0]["confidence"] is None
+    assert analysis["brands"][0]["rectangle"] is None
+    assert analysis["ocr"] == {"status": None, "text_results": [{"text": None, "bounding_box": []}]}
+    # スキーマにないキーも捨てずに返す
+    assert analysis["faces"] == [{"age": 3}]
+
+    # DBには検証済みペイロードを保存し、Azureが返さなかったキーは足さない
+    stored = session.add.call_args.args[0].azure_analysis
+    assert stored["color"]["dominant_colors"] == []
+    assert stored["faces"] == [{"age": 3}]
+    assert "description" not in stored
+
+
+@pytest.mark.fast
+def test_analyze_rejects_malformed_payload_before_commit(client, analyze_env):
+    vision, session, delete_image_file = analyze_env
+    vision.analyze_image.return_value = {"tags": "not-a-list"}
+    vision.analyze_image_with_text.return_value = None
+
+    response = client.post(ANALYZE_URL, files={"file": ("sample.png", b"png", "image/png")})
+
+    assert response.status_code == 500
+    session.commit.assert_not_awaited()
+    delete_image_file.assert_awaited_once_with(FILE_INFO["file_path"])
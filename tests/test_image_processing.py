@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""ImageProcessingService のアップロード検証テスト（DB・Azure不要）"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.image_processing import ImageProcessingService, _sniff_mime
+
+
+def make_png_bytes(size=(8, 8)) -> bytes:
+    """テスト用のPNG画像バイト列を生成"""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=(255, 0, 0)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def service(tmp_path):
+    """アップロード先を一時ディレクトリに向けたサービス"""
+    service = ImageProcessingService()
+    service.upload_dir = tmp_path
+    return service
+
+
+@pytest.mark.fast
+async def test_validate_and_save_image_streams_to_disk(service, tmp_path):
+    content = make_png_bytes()
+    upload = UploadFile(file=io.BytesIO(content), filename="red.png")
+
+    result = await service.validate_and_save_image(upload)
+
+    saved = Path(result["file_path"])
+    assert saved.parent == tmp_path
+    assert saved.read_bytes() == content
+    assert result["file_size"] == len(content)
+    assert result["content_type"] == "image/png"
+    assert result["image_info"]["width"] == 8
+
+
+@pytest.mark.fast
+async def test_validate_and_save_image_rejects_oversized_upload(service, tmp_path):
+    content = make_png_bytes(size=(256, 256))
+    service.max_file_size = len(content) - 1
+    upload = UploadFile(file=io.BytesIO(content), filename="big.png")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.validate_and_save_image(upload)
+
+    assert exc_info.value.status_code == 413
+    # 途中まで書き込んだファイルは削除される
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.fast
+async def test_validate_and_save_image_rejects_unsupported_type(service):
+    upload = UploadFile(file=io.BytesIO(b"plain text, not an image"), filename="a.txt")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.validate_and_save_image(upload)
+
+    assert exc_info.value.status_code == 415
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("image_format,expected", [
+    ("JPEG", "image/jpeg"),
+    ("PNG", "image/png"),
+    ("WEBP", "image/webp"),
+])
+def test_sniff_mime_detects_supported_formats(image_format, expected):
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(buffer, format=image_format)
+    assert _sniff_mime(buffer.getvalue()) == expected
+
+
+@pytest.mark.fast
+def test_sniff_mime_returns_none_for_unknown_data():
+    assert _sniff_mime(b"GIF89a") is None
+    assert _sniff_mime(b"") is None
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size_bytes,expected", [
+    (0, "0.0 B"),
+    (1023, "1023.0 B"),
+    (1024, "1.0 KB"),
+    (1536, "1.5 KB"),
+    (10 * 1024 * 1024, "10.0 MB"),
+    (3 * 1024 ** 3, "3.0 GB"),
+    (2 * 1024 ** 4, "2.0 TB"),
+    (2048 * 1024 ** 4, "2048.0 TB"),
+])
+def test_get_file_size_formatted(service, size_bytes, expected):
+    assert service.get_file_size_formatted(size_bytes) == expected
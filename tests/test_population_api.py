@@ -5,24 +5,14 @@ import sys
 from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
 # Ensure the application package is importable when running tests directly
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.main import app
-
-
-client = TestClient(app)
-
 
 @pytest.mark.fast
-def test_population_over_four_million_1990():
-    response = client.get("/api/v1/population/1990/over4million")
-
-    assert response.status_code == 200
-
-    payload = response.json()
+def test_population_over_four_million_1990(pop_1990):
+    payload = pop_1990
 
     assert payload["year"] == 1990
     assert payload["threshold"] == 4_000_000
@@ -64,12 +54,8 @@ def test_population_over_four_million_1990():
 
 
 @pytest.mark.fast
-def test_population_over_two_million_by_year():
-    response = client.get("/api/v1/population/1980_2000/over2million")
-
-    assert response.status_code == 200
-
-    payload = response.json()
+def test_population_over_two_million_by_year(pop_1980_2000):
+    payload = pop_1980_2000
 
     assert payload["threshold"] == 2_000_000
     assert payload["unit"] == "people"
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Todo一括作成API（POST /api/v1/todos/bulk）のテスト（DBはモック）"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import get_db
+from app.models.todo import Todo
+
+BULK_URL = "/api/v1/todos/bulk"
+
+
+@pytest.fixture
+def bulk_session(client, mock_db_session):
+    """INSERT ... RETURNING の結果を、渡されたパラメータの順にid 101〜で返すセッション"""
+    async def scalars(statement, params):
+        now = datetime.now(timezone.utc)
+        result = MagicMock()
+        result.all.return_value = [
+            Todo(id=101 + i, completed=False, created_at=now, updated_at=now, **row)
+            for i, row in enumerate(params)
+        ]
+        return result
+
+    mock_db_session.scalars.side_effect = scalars
+    client.app.dependency_overrides[get_db] = lambda: mock_db_session
+    yield mock_db_session
+    client.app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.mark.fast
+def test_bulk_create_returns_items_in_input_order(client, bulk_session):
+    items = [
+        {"title": "一括1", "priority": 2},
+        {"title": "一括2", "description": "説明あり"},
+        {"title": "一括3", "priority": 1},
+    ]
+
+    response = client.post(BULK_URL, json={"items": items})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert [todo["id"] for todo in data["items"]] == [101, 102, 103]
+    assert [todo["title"] for todo in data["items"]] == ["一括1", "一括2", "一括3"]
+    assert data["items"][1]["description"] == "説明あり"
+    assert [todo["priority"] for todo in data["items"]] == [2, 0, 1]
+
+    # 1回のINSERTに入力順のパラメータをまとめて渡す
+    bulk_session.scalars.assert_awaited_once()
+    params = bulk_session.scalars.await_args.args[1]
+    assert [row["title"] for row in params] == ["一括1", "一括2", "一括3"]
+    bulk_session.commit.assert_awaited_once()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("count", [0, 1001], ids=["empty", "oversized"])
+def test_bulk_create_rejects_item_count_out_of_range(client, bulk_session, count):
+    items = [{"title": f"Todo {i}"} for i in range(count)]
+
+    response = client.post(BULK_URL, json={"items": items})
+
+    assert response.status_code == 422
+    bulk_session.scalars.assert_not_awaited()
+    bulk_session.commit.assert_not_awaited()
@@ -4,21 +4,112 @@ Todo CRUD 詳細テストスクリプト
 SwaggerUI仕様に基づいて各CRUD操作を個別にテストします。
 """
 
-import requests
-import json
-import time
+import asyncio
+import httpx
+import orjson
+import os
+import pytest
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any, List
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.http_cache import VCR_MODE, CachingTransport
+
+# 共有接続プールの上限と、接続失敗時の再試行回数
+MAX_CONNECTIONS = 16
+CONNECT_RETRIES = 2
+
 
 class TodoCRUDTester:
     """Todo CRUD 詳細テスト専用クラス"""
     
-    def __init__(self, base_url: str = "http://127.0.0.1:8001"):
+    # 作成テストのケース（本文はクラス定義時に一度だけシリアライズしておく）
+    CREATE_CASES = [
+        {
+            "name": "基本Todo作成",
+            "data": {
+                "title": "基本的なTodo",
+                "description": "シンプルな作成テスト",
+                "priority": 0  # Low
+            }
+        },
+        {
+            "name": "優先度HIGH Todo作成", 
+            "data": {
+                "title": "重要なタスク",
+                "description": "優先度の高いタスクです",
+                "priority": 2  # High
+            }
+        },
+        {
+            "name": "日本語Todo作成",
+            "data": {
+                "title": "日本語のタスク 🎌",
+                "description": "日本語の説明文です。絵文字も含まれています。",
+                "priority": 1  # Medium
+            }
+        },
+        {
+            "name": "最小限Todo作成",
+            "data": {
+                "title": "最小限のタスク"
+                # descriptionとpriorityを省略
+            }
+        }
+    ]
+    BULK_CREATE_BODY = orjson.dumps({"items": [case["data"] for case in CREATE_CASES]})
+    
+    # 更新テストで送る固定のPATCH本文
+    UPDATE_BODIES = {
+        "title": orjson.dumps({"title": "更新されたタイトル"}),
+        "multiple": orjson.dumps({
+            "description": "更新された説明文",
+            "priority": 1,  # Medium
+            "completed": False
+        }),
+        "completed": orjson.dumps({"completed": True}),
+    }
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    
+    def __init__(self, base_url: str = "http://127.0.0.1:8001", verbose: bool = False):
         self.base_url = base_url
-        self.api_url = f"{base_url}/api/v1/todos"
+        self.verbose = verbose  # True のときレスポンス本文も表示
+        self.api_url = "/api/v1/todos"
         self.created_todos = []  # テストで作成したTodoのIDリスト
         self.test_results = {}
+        self.client = None
+        self.cached_client = None
+    
+    async def __aenter__(self):
+        # 全テストで1つの非同期クライアント（接続プール）を共有
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+            retries=CONNECT_RETRIES,
+        )
+        # /api/v1/todos は末尾スラッシュ付きURLへ307リダイレクトされるため追従する
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url, transport=transport, timeout=10, follow_redirects=True
+        )
+        
+        # 結果が決定的なリクエスト用（VCR_MODE=cache のときのみ記録・再生）
+        if VCR_MODE == "cache":
+            self.cached_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                transport=CachingTransport(httpx.AsyncHTTPTransport(retries=CONNECT_RETRIES)),
+                timeout=10,
+                follow_redirects=True,
+            )
+        else:
+            self.cached_client = self.client
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.cached_client is not self.client:
+            await self.cached_client.aclose()
+        await self.client.aclose()
         
     def print_section(self, title: str):
         """セクション区切りを表示"""
@@ -26,27 +117,27 @@ class TodoCRUDTester:
         print(f"🔥 {title}")
         print('='*80)
         
-    def print_test_result(self, test_name: str, success: bool, response: requests.Response, details: str = ""):
+    def print_test_result(self, test_name: str, success: bool, response: httpx.Response, details: str = ""):
         """テスト結果を整形して出力"""
         status = "✅ PASS" if success else "❌ FAIL"
         print(f"\n{status} {test_name}")
         print(f"   Status: {response.status_code}")
         
-        # レスポンスの表示
-        try:
-            if response.text:
-                response_data = response.json()
-                if len(str(response_data)) > 500:  # 長い場合は要約
+        # レスポンスの表示（verbose 時のみ。長さはバイト数で判定し、必要なときだけパース）
+        if self.verbose and response.content:
+            try:
+                response_data = orjson.loads(response.content)
+                if len(response.content) > 500:  # 長い場合は要約
                     if isinstance(response_data, dict) and 'items' in response_data:
                         print(f"   Items: {len(response_data['items'])}")
                         if response_data['items']:
                             print(f"   Sample: {response_data['items'][0].get('title', 'N/A')}")
                     else:
-                        print(f"   Response: {str(response_data)[:200]}...")
+                        print(f"   Response: {response.text[:200]}...")
                 else:
-                    print(f"   Response: {json.dumps(response_data, indent=2, ensure_ascii=False)}")
-        except Exception as e:
-            print(f"   Response: {response.text}")
+                    print(f"   Response: {orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode()}")
+            except orjson.JSONDecodeError:
+                print(f"   Response: {response.text}")
             
         if details:
             print(f"   Details: {details}")
@@ -58,77 +149,42 @@ class TodoCRUDTester:
     # CREATE (作成) テスト
     # =============================================
     
-    def test_create_basic(self):
+    async def test_create_basic(self):
         """基本的なTodo作成テスト"""
         self.print_section("CREATE 操作テスト")
         
-        test_cases = [
-            {
-                "name": "基本Todo作成",
-                "data": {
-                    "title": "基本的なTodo",
-                    "description": "シンプルな作成テスト",
-                    "priority": 0  # Low
-                }
-            },
-            {
-                "name": "優先度HIGH Todo作成", 
-                "data": {
-                    "title": "重要なタスク",
-                    "description": "優先度の高いタスクです",
-                    "priority": 2  # High
-                }
-            },
-            {
-                "name": "日本語Todo作成",
-                "data": {
-                    "title": "日本語のタスク 🎌",
-                    "description": "日本語の説明文です。絵文字も含まれています。",
-                    "priority": 1  # Medium
-                }
-            },
-            {
-                "name": "最小限Todo作成",
-                "data": {
-                    "title": "最小限のタスク"
-                    # descriptionとpriorityを省略
-                }
-            }
-        ]
+        # 全ケースを一括作成エンドポイントで1回のリクエストにまとめる
+        try:
+            response = await self.client.post(
+                f"{self.api_url}/bulk",
+                content=self.BULK_CREATE_BODY,
+                headers=self.JSON_HEADERS
+            )
+        except Exception as e:
+            print(f"❌ 一括Todo作成 - Exception: {e}")
+            return False
         
-        results = []
-        for case in test_cases:
-            try:
-                response = requests.post(
-                    self.api_url,
-                    json=case["data"],
-                    headers={"Content-Type": "application/json"},
-                    timeout=10
-                )
-                
-                success = response.status_code == 200
-                if success:
-                    todo_data = response.json()
-                    self.created_todos.append(todo_data["id"])
-                    details = f"Created ID: {todo_data['id']} | Title: '{todo_data['title']}'"
-                else:
-                    details = "作成に失敗"
-                    
-                results.append(self.print_test_result(
-                    case["name"], success, response, details
-                ))
-                
-            except Exception as e:
-                print(f"❌ {case['name']} - Exception: {e}")
-                results.append(False)
+        success = response.status_code == 200
+        if success:
+            items = orjson.loads(response.content)["items"]
+            success = len(items) == len(self.CREATE_CASES)
+            # レスポンスは入力と同じ順序
+            self.created_todos.extend(item["id"] for item in items)
+            details = " | ".join(
+                f"{case['name']}: ID {item['id']}" for case, item in zip(self.CREATE_CASES, items)
+            )
+        else:
+            details = "作成に失敗"
         
-        return all(results)
+        return self.print_test_result(
+            f"一括Todo作成 ({len(self.CREATE_CASES)}件)", success, response, details
+        )
 
     # =============================================
     # READ (読み取り) テスト 
     # =============================================
     
-    def test_read_operations(self):
+    async def test_read_operations(self):
         """読み取り操作の詳細テスト"""
         self.print_section("READ 操作テスト")
         
@@ -136,10 +192,10 @@ class TodoCRUDTester:
         
         # 1. 全件取得テスト
         try:
-            response = requests.get(self.api_url, timeout=5)
+            response = await self.client.get(self.api_url, timeout=5)
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 details = f"Total: {data['total']} | Items: {len(data['items'])}"
             else:
                 details = "取得失敗"
@@ -154,10 +210,10 @@ class TodoCRUDTester:
         if self.created_todos:
             todo_id = self.created_todos[0]
             try:
-                response = requests.get(f"{self.api_url}/{todo_id}", timeout=5)
+                response = await self.client.get(f"{self.api_url}/{todo_id}", timeout=5)
                 success = response.status_code == 200
                 if success:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     details = f"ID: {data['id']} | Title: '{data['title']}'"
                 else:
                     details = f"取得失敗 (ID: {todo_id})"
@@ -176,12 +232,20 @@ class TodoCRUDTester:
             {"params": {"include_deleted": False}, "name": "削除済み除外"}
         ]
         
-        for filter_test in filter_tests:
+        # フィルタ条件ごとのGETも並行実行
+        responses = await asyncio.gather(
+            *(self.client.get(self.api_url, params=filter_test["params"], timeout=5)
+              for filter_test in filter_tests),
+            return_exceptions=True
+        )
+        
+        for filter_test, response in zip(filter_tests, responses):
             try:
-                response = requests.get(self.api_url, params=filter_test["params"], timeout=5)
+                if isinstance(response, Exception):
+                    raise response
                 success = response.status_code == 200
                 if success:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     details = f"Filtered Items: {len(data['items'])}"
                 else:
                     details = "フィルタリング失敗"
@@ -198,7 +262,7 @@ class TodoCRUDTester:
     # UPDATE (更新) テスト
     # =============================================
     
-    def test_update_operations(self):
+    async def test_update_operations(self):
         """更新操作の詳細テスト"""
         self.print_section("UPDATE 操作テスト")
         
@@ -211,17 +275,16 @@ class TodoCRUDTester:
         
         # 1. タイトル更新テスト
         try:
-            update_data = {"title": "更新されたタイトル"}
-            response = requests.patch(
+            response = await self.client.patch(
                 f"{self.api_url}/{todo_id}",
-                json=update_data,
-                headers={"Content-Type": "application/json"},
+                content=self.UPDATE_BODIES["title"],
+                headers=self.JSON_HEADERS,
                 timeout=10
             )
             
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 details = f"New Title: '{data['title']}'"
             else:
                 details = "タイトル更新失敗"
@@ -234,21 +297,16 @@ class TodoCRUDTester:
         
         # 2. 複数フィールド更新テスト
         try:
-            update_data = {
-                "description": "更新された説明文",
-                "priority": 1,  # Medium
-                "completed": False
-            }
-            response = requests.patch(
+            response = await self.client.patch(
                 f"{self.api_url}/{todo_id}",
-                json=update_data,
-                headers={"Content-Type": "application/json"},
+                content=self.UPDATE_BODIES["multiple"],
+                headers=self.JSON_HEADERS,
                 timeout=10
             )
             
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 details = f"Priority: {data['priority']} | Completed: {data['completed']}"
             else:
                 details = "複数フィールド更新失敗"
@@ -261,17 +319,16 @@ class TodoCRUDTester:
         
         # 3. 完了フラグ更新（タイムスタンプ確認）
         try:
-            update_data = {"completed": True}
-            response = requests.patch(
+            response = await self.client.patch(
                 f"{self.api_url}/{todo_id}",
-                json=update_data,
-                headers={"Content-Type": "application/json"},
+                content=self.UPDATE_BODIES["completed"],
+                headers=self.JSON_HEADERS,
                 timeout=10
             )
             
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 completed_at = data.get('completed_at_jst')
                 details = f"Completed: {data['completed']} | Completed at: {completed_at}"
             else:
@@ -289,7 +346,7 @@ class TodoCRUDTester:
     # DELETE (削除) テスト
     # =============================================
     
-    def test_delete_operations(self):
+    async def test_delete_operations(self):
         """削除操作の詳細テスト（論理削除・物理削除）"""
         self.print_section("DELETE 操作テスト")
         
@@ -302,7 +359,7 @@ class TodoCRUDTester:
         # 1. 論理削除テスト
         todo_id_soft = self.created_todos[1]  # 2番目のTodoを使用
         try:
-            response = requests.delete(
+            response = await self.client.delete(
                 f"{self.api_url}/{todo_id_soft}",
                 params={"permanent": False},  # 論理削除
                 timeout=10
@@ -310,7 +367,7 @@ class TodoCRUDTester:
             
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 deleted_at = data.get('deleted_at_jst')
                 details = f"Soft deleted at: {deleted_at}"
             else:
@@ -324,7 +381,7 @@ class TodoCRUDTester:
         
         # 2. 論理削除されたTodoが通常の取得で見えないことを確認
         try:
-            response = requests.get(f"{self.api_url}/{todo_id_soft}", timeout=5)
+            response = await self.client.get(f"{self.api_url}/{todo_id_soft}", timeout=5)
             success = response.status_code == 404  # 見えないはず
             details = "論理削除されたTodoは通常取得で見えない" if success else "論理削除が機能していない"
             results.append(self.print_test_result(
@@ -336,14 +393,14 @@ class TodoCRUDTester:
         
         # 3. include_deletedで論理削除されたTodoを取得
         try:
-            response = requests.get(
+            response = await self.client.get(
                 f"{self.api_url}/{todo_id_soft}",
                 params={"include_deleted": True},
                 timeout=5
             )
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 details = f"Deleted Todo found: '{data['title']}'"
             else:
                 details = "削除済みTodo取得失敗"
@@ -360,7 +417,7 @@ class TodoCRUDTester:
     # 特殊操作テスト
     # =============================================
     
-    def test_special_operations(self):
+    async def test_special_operations(self):
         """復元・完了などの特殊操作テスト"""
         self.print_section("SPECIAL 操作テスト")
         
@@ -375,10 +432,10 @@ class TodoCRUDTester:
         
         # 1. 復元テスト
         try:
-            response = requests.post(f"{self.api_url}/{todo_id_deleted}/restore", timeout=10)
+            response = await self.client.post(f"{self.api_url}/{todo_id_deleted}/restore", timeout=10)
             success = response.status_code == 200
             if success:
-                data = response.json()
+                data = orjson.loads(response.content)
                 deleted_at = data.get('deleted_at')
                 details = f"Restored: deleted_at={deleted_at}"
             else:
@@ -394,10 +451,10 @@ class TodoCRUDTester:
         if self.created_todos:
             todo_id_complete = self.created_todos[0]
             try:
-                response = requests.post(f"{self.api_url}/{todo_id_complete}/complete", timeout=10)
+                response = await self.client.post(f"{self.api_url}/{todo_id_complete}/complete", timeout=10)
                 success = response.status_code == 200
                 if success:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     completed_at = data.get('completed_at_jst')
                     details = f"Completed: {data['completed']} | Time: {completed_at}"
                 else:
@@ -415,7 +472,7 @@ class TodoCRUDTester:
     # エラーケーステスト
     # =============================================
     
-    def test_error_cases(self):
+    async def test_error_cases(self):
         """エラーケースのテスト"""
         self.print_section("ERROR CASES テスト")
         
@@ -423,7 +480,7 @@ class TodoCRUDTester:
         
         # 1. 存在しないTodo取得
         try:
-            response = requests.get(f"{self.api_url}/99999", timeout=5)
+            response = await self.cached_client.get(f"{self.api_url}/99999", timeout=5)
             success = response.status_code == 404
             details = "存在しないTodoで404エラー" if success else "エラーハンドリング不正"
             results.append(self.print_test_result(
@@ -436,10 +493,9 @@ class TodoCRUDTester:
         # 2. 無効なデータでTodo作成
         try:
             invalid_data = {"title": ""}  # 空のタイトル
-            response = requests.post(
+            response = await self.cached_client.post(
                 self.api_url,
                 json=invalid_data,
-                headers={"Content-Type": "application/json"},
                 timeout=10
             )
             success = response.status_code == 422  # Validation Error
@@ -454,10 +510,9 @@ class TodoCRUDTester:
         # 3. 無効な優先度
         try:
             invalid_data = {"title": "テスト", "priority": 5}  # 無効な優先度
-            response = requests.post(
+            response = await self.cached_client.post(
                 self.api_url,
                 json=invalid_data,
-                headers={"Content-Type": "application/json"},
                 timeout=10
             )
             success = response.status_code == 422  # Validation Error
@@ -475,7 +530,19 @@ class TodoCRUDTester:
     # メインテスト実行
     # =============================================
     
-    def run_comprehensive_tests(self):
+    async def _run_test_set(self, test_name: str, test_func) -> tuple:
+        """テストセットを1つ実行し、(テスト名, 結果) を返す"""
+        print(f"\n🔥 Starting: {test_name}")
+        try:
+            result = await test_func()
+            status = "✅ PASS" if result else "❌ FAIL"
+            print(f"\n{status} {test_name} Complete")
+            return test_name, result
+        except Exception as e:
+            print(f"❌ {test_name} - Unexpected Error: {e}")
+            return test_name, False
+    
+    async def run_comprehensive_tests(self):
         """包括的なCRUDテストを実行"""
         print("🚀" * 30)
         print("🔥 Todo CRUD 包括テスト開始 🔥")
@@ -483,31 +550,25 @@ class TodoCRUDTester:
         print(f"⏰ Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("🚀" * 30)
         
-        # 各テストの実行
-        test_functions = [
-            ("CREATE Operations", self.test_create_basic),
-            ("READ Operations", self.test_read_operations), 
-            ("UPDATE Operations", self.test_update_operations),
-            ("DELETE Operations", self.test_delete_operations),
-            ("SPECIAL Operations", self.test_special_operations),
-            ("ERROR Cases", self.test_error_cases)
+        # 各テストの実行（同じステージ内のテストは互いに独立しているので並行実行）
+        # READ / ERROR は作成済みTodoを変更しないため同時に実行できる。
+        # SPECIAL の復元は DELETE で論理削除したTodoが前提なので順番に実行する。
+        stages = [
+            [("CREATE Operations", self.test_create_basic)],
+            [("READ Operations", self.test_read_operations),
+             ("ERROR Cases", self.test_error_cases)],
+            [("UPDATE Operations", self.test_update_operations)],
+            [("DELETE Operations", self.test_delete_operations)],
+            [("SPECIAL Operations", self.test_special_operations)],
         ]
         
         overall_results = {}
         
-        for test_name, test_func in test_functions:
-            print(f"\n🔥 Starting: {test_name}")
-            try:
-                result = test_func()
-                overall_results[test_name] = result
-                status = "✅ PASS" if result else "❌ FAIL"
-                print(f"\n{status} {test_name} Complete")
-            except Exception as e:
-                print(f"❌ {test_name} - Unexpected Error: {e}")
-                overall_results[test_name] = False
-                
-            # 各テスト間で少し待機
-            time.sleep(0.5)
+        for stage in stages:
+            stage_results = await asyncio.gather(
+                *(self._run_test_set(test_name, test_func) for test_name, test_func in stage)
+            )
+            overall_results.update(stage_results)
         
         # 最終結果サマリ
         self.print_section("📊 最終テスト結果サマリ")
@@ -533,10 +594,118 @@ class TodoCRUDTester:
         return passed == total
 
 
+
+# =============================================
+# pytest 用テスト（稼働中のサーバーに対して実行）
+# =============================================
+
+TODO_API_URL = os.getenv("TODO_API_URL", "http://127.0.0.1:8001")
+TODOS_PATH = "/api/v1/todos"
+
+# モジュール内で1回だけ作成するTodo（テストごとに専用のインデックスを使い、互いに干渉しない）
+SEED_TODOS = [
+    {"title": "更新テスト用Todo", "description": "タイトル更新", "priority": 0},
+    {"title": "複数フィールド更新用Todo", "description": "複数更新", "priority": 2},
+    {"title": "削除テスト用Todo 🎌", "description": "論理削除と復元", "priority": 1},
+    {"title": "完了テスト用Todo"},
+    {"title": "取得テスト用Todo", "description": "個別取得（変更しない）"},
+]
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    """稼働中のTodo APIへのクライアント（接続できなければモジュールごとスキップ）"""
+    with httpx.Client(base_url=TODO_API_URL, timeout=10, follow_redirects=True) as client:
+        try:
+            client.get("/health", timeout=2)
+        except httpx.TransportError:
+            pytest.skip(f"Todo API サーバーに接続できません: {TODO_API_URL}")
+        yield client
+
+
+@pytest.fixture(scope="module")
+def todo_ids(api_client):
+    """テスト用Todoを作成してIDを返し、終了後に物理削除"""
+    ids = [api_client.post(TODOS_PATH, json=data).json()["id"] for data in SEED_TODOS]
+    yield ids
+    for todo_id in ids:
+        api_client.delete(f"{TODOS_PATH}/{todo_id}", params={"permanent": True})
+
+
+@pytest.mark.slow
+def test_get_todo_by_id(api_client, todo_ids):
+    response = api_client.get(f"{TODOS_PATH}/{todo_ids[4]}")
+    assert response.status_code == 200
+    assert response.json()["title"] == SEED_TODOS[4]["title"]
+
+
+@pytest.mark.slow
+def test_update_title(api_client, todo_ids):
+    response = api_client.patch(f"{TODOS_PATH}/{todo_ids[0]}", json={"title": "更新されたタイトル"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "更新されたタイトル"
+
+
+@pytest.mark.slow
+def test_update_multiple_fields(api_client, todo_ids):
+    response = api_client.patch(
+        f"{TODOS_PATH}/{todo_ids[1]}",
+        json={"description": "更新された説明文", "priority": 1, "completed": True},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["priority"] == 1
+    assert data["completed"] is True
+    assert data["completed_at"] is not None
+
+
+@pytest.mark.slow
+def test_soft_delete_and_restore(api_client, todo_ids):
+    todo_url = f"{TODOS_PATH}/{todo_ids[2]}"
+
+    assert api_client.delete(todo_url, params={"permanent": False}).status_code == 200
+    # 論理削除後は通常取得では見えず、include_deleted で取得できる
+    assert api_client.get(todo_url).status_code == 404
+    assert api_client.get(todo_url, params={"include_deleted": True}).status_code == 200
+
+    response = api_client.post(f"{todo_url}/restore")
+    assert response.status_code == 200
+    assert response.json()["deleted_at"] is None
+
+
+@pytest.mark.slow
+def test_complete_todo(api_client, todo_ids):
+    response = api_client.post(f"{TODOS_PATH}/{todo_ids[3]}/complete")
+    assert response.status_code == 200
+    assert response.json()["completed"] is True
+
+
+@pytest.mark.slow
+def test_bulk_create_preserves_order(api_client):
+    items = [{"title": f"一括作成 {i}", "priority": i % 3} for i in range(5)]
+    response = api_client.post(f"{TODOS_PATH}/bulk", json={"items": items})
+    assert response.status_code == 200
+    created = response.json()["items"]
+    try:
+        assert [todo["title"] for todo in created] == [item["title"] for item in items]
+        assert [todo["priority"] for todo in created] == [item["priority"] for item in items]
+    finally:
+        for todo in created:
+            api_client.delete(f"{TODOS_PATH}/{todo['id']}", params={"permanent": True})
+
+
+@pytest.mark.slow
+def test_get_missing_todo_returns_404(api_client):
+    assert api_client.get(f"{TODOS_PATH}/99999").status_code == 404
+
+
 if __name__ == "__main__":
     # 詳細CRUDテストを実行
-    tester = TodoCRUDTester()
-    success = tester.run_comprehensive_tests()
+    async def main():
+        async with TodoCRUDTester(verbose="--verbose" in sys.argv) as tester:
+            return await tester.run_comprehensive_tests()
+    
+    success = asyncio.run(main())
     
     # 終了コード
     exit(0 if success else 1)
\ No newline at end of file
@@ -4,10 +4,15 @@ Event Loop Closedエラーの完全解決版
 データベースに依存しない独立したテストアプリを使用
 """
 
+import asyncio
+import itertools
+import orjson
 import pytest
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.testclient import TestClient
-from datetime import datetime
+import time
+import traceback
 from typing import Optional
 
 # =====================================
@@ -17,17 +22,83 @@ from typing import Optional
 test_app = FastAPI(title="Test Todo API")
 
 # インメモリストレージ（テスト用）
-todo_storage = {}
-next_id = 1
+# 行データ・ID→位置の索引・削除フラグを並列の配列で持ち、一覧の絞り込みを1バイト参照で済ませる
+_rows: list[Optional[dict]] = []
+_id_to_index: dict[int, int] = {}
+_deleted = bytearray()
+# IDの採番（next() 1回で払い出し、グローバル変数の書き換えを伴わない）
+_id_counter = itertools.count(1)
+# 一覧レスポンスのシリアライズ済みキャッシュ（ストレージを変更したら None に戻す）
+_cached_list_bytes: Optional[bytes] = None
+# ストレージの変更ごとに増える版番号（一覧のETagに使う。リセット時も戻さない）
+_version = 0
+
+def _invalidate_list_cache():
+    """一覧レスポンスのキャッシュを破棄し、版番号を進める"""
+    global _cached_list_bytes, _version
+    _cached_list_bytes = None
+    _version += 1
+
+def _reset_ids():
+    """IDの採番を1からやり直す"""
+    global _id_counter
+    _id_counter = itertools.count(1)
+
+def reset_storage():
+    """ストレージとIDの採番を初期化"""
+    _rows.clear()
+    _id_to_index.clear()
+    _deleted.clear()
+    _reset_ids()
+    _invalidate_list_cache()
+
+def _seed_todo(title: str, description: Optional[str] = None, priority: int = 0) -> dict:
+    """Todoをストレージへ直接追加（テストの前提データ作成ではHTTPを経由せずに使う）"""
+    now = _now_iso()
+    
+    todo_data = {
+        "id": (new_id := next(_id_counter)),
+        "title": title,
+        "description": description,
+        "completed": False,
+        "priority": priority,
+        "created_at": now,
+        "updated_at": now,
+    }
+    
+    _id_to_index[new_id] = len(_rows)
+    _rows.append(todo_data)
+    _deleted.append(0)
+    _invalidate_list_cache()
+    
+    return todo_data
+
+_TZ_SUFFIX = "+09:00[Asia/Tokyo]"
+
+# PATCHで更新を許可するフィールド
+_UPDATABLE_FIELDS = frozenset({"completed", "priority", "title", "description"})
+
+def _now_iso() -> str:
+    """現在時刻を日本時間のISO形式で返す（datetime生成とstrftimeを経由しない）"""
+    t = time.localtime()
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}{_TZ_SUFFIX}"
 
 # テスト用のPydanticモデル
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 class TodoCreate(BaseModel):
     title: str
     description: Optional[str] = None
     priority: int = 0
 
+    @field_validator('title')
+    @classmethod
+    def validate_title_not_blank(cls, v):
+        # 空文字・空白のみのタイトルはハンドラに届く前に422で弾く
+        if not v or v.isspace():
+            raise ValueError('Title cannot be empty')
+        return v
+
 class TodoResponse(BaseModel):
     id: int
     title: str
@@ -45,105 +116,96 @@ class TodoListResponse(BaseModel):
 # テスト用のAPIエンドポイント
 # =====================================
 
+# 固定レスポンスはモジュール読み込み時に一度だけシリアライズ
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to FastAPI Test Application",
+    "version": "1.0.0",
+    "endpoints": [
+        "/health",
+        "/api/v1/todos"
+    ]
+})
+
 @test_app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+async def health_check():
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 @test_app.get("/")
-def root():
-    return {
-        "message": "Welcome to FastAPI Test Application",
-        "version": "1.0.0",
-        "endpoints": [
-            "/health",
-            "/api/v1/todos"
-        ]
-    }
+async def root():
+    return Response(_ROOT_BODY, media_type="application/json")
 
 @test_app.get("/api/v1/todos", response_model=TodoListResponse)
-def get_todos():
+async def get_todos(request: Request):
     """Todo一覧を取得"""
-    items = []
-    for todo_id, todo_data in todo_storage.items():
-        if not todo_data.get("deleted", False):
-            items.append(TodoResponse(**todo_data))
+    global _cached_list_bytes
+    # クライアントが最新版を持っていれば本文なしの304を返す
+    etag = f'W/"{_version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"etag": etag})
+    
+    # 変更がなければ前回シリアライズしたバイト列をそのまま返す
+    if _cached_list_bytes is None:
+        # 保存済みのdictはint/str/bool/Noneのみなので、モデルを経由せずorjsonで直接シリアライズ
+        items = [row for row, deleted in zip(_rows, _deleted) if not deleted]
+        _cached_list_bytes = orjson.dumps({"total": len(items), "items": items})
     
-    return TodoListResponse(total=len(items), items=items)
+    return Response(_cached_list_bytes, media_type="application/json", headers={"etag": etag})
 
 @test_app.post("/api/v1/todos", response_model=TodoResponse)
-def create_todo(todo: TodoCreate):
+async def create_todo(todo: TodoCreate):
     """新しいTodoを作成"""
-    global next_id
-    
-    if not todo.title.strip():
-        raise HTTPException(status_code=422, detail="Title cannot be empty")
-    
-    now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S+09:00[Asia/Tokyo]")
-    
-    todo_data = {
-        "id": next_id,
-        "title": todo.title,
-        "description": todo.description,
-        "completed": False,
-        "priority": todo.priority,
-        "created_at": now,
-        "updated_at": now,
-        "deleted": False
-    }
-    
-    todo_storage[next_id] = todo_data
-    next_id += 1
-    
-    return TodoResponse(**todo_data)
+    return ORJSONResponse(_seed_todo(todo.title, todo.description, todo.priority))
 
 @test_app.get("/api/v1/todos/{todo_id}", response_model=TodoResponse)
-def get_todo(todo_id: int):
+async def get_todo(todo_id: int):
     """特定のTodoを取得"""
-    if todo_id not in todo_storage or todo_storage[todo_id].get("deleted", False):
+    index = _id_to_index.get(todo_id)
+    if index is None or _deleted[index]:
         raise HTTPException(status_code=404, detail="Todo not found")
     
-    return TodoResponse(**todo_storage[todo_id])
+    return ORJSONResponse(_rows[index])
 
 @test_app.patch("/api/v1/todos/{todo_id}", response_model=TodoResponse)
-def update_todo(todo_id: int, update_data: dict):
+async def update_todo(todo_id: int, update_data: dict):
     """Todoを更新"""
-    if todo_id not in todo_storage or todo_storage[todo_id].get("deleted", False):
+    index = _id_to_index.get(todo_id)
+    if index is None or _deleted[index]:
         raise HTTPException(status_code=404, detail="Todo not found")
     
-    todo = todo_storage[todo_id]
+    todo = _rows[index]
     
     # 更新可能フィールドのみ更新
-    if "completed" in update_data:
-        todo["completed"] = update_data["completed"]
-    if "priority" in update_data:
-        todo["priority"] = update_data["priority"]
-    if "title" in update_data:
-        todo["title"] = update_data["title"]
-    if "description" in update_data:
-        todo["description"] = update_data["description"]
+    for field in _UPDATABLE_FIELDS.intersection(update_data):
+        todo[field] = update_data[field]
     
-    todo["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S+09:00[Asia/Tokyo]")
+    todo["updated_at"] = _now_iso()
+    _invalidate_list_cache()
     
-    return TodoResponse(**todo)
+    return ORJSONResponse(todo)
 
 @test_app.delete("/api/v1/todos/{todo_id}", response_model=TodoResponse)
-def delete_todo(todo_id: int, permanent: bool = False):
+async def delete_todo(todo_id: int, permanent: bool = False):
     """Todoを削除"""
-    if todo_id not in todo_storage:
+    index = _id_to_index.get(todo_id)
+    if index is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     
-    todo = todo_storage[todo_id]
+    todo = _rows[index]
+    _invalidate_list_cache()
     
     if permanent:
-        # 物理削除
-        deleted_todo = todo.copy()
-        del todo_storage[todo_id]
-        return TodoResponse(**deleted_todo)
+        # 物理削除（位置をずらさないよう、索引から外して行を空けるだけにする）
+        # 行のdictはローカル変数 todo が参照しているのでコピー不要
+        del _id_to_index[todo_id]
+        _rows[index] = None
+        _deleted[index] = 1
+        return ORJSONResponse(todo)
     else:
         # 論理削除
-        todo["deleted"] = True
-        todo["updated_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S+09:00[Asia/Tokyo]")
-        return TodoResponse(**todo)
+        _deleted[index] = 1
+        todo["updated_at"] = _now_iso()
+        return ORJSONResponse(todo)
 
 # TestClientを作成
 client = TestClient(test_app)
@@ -171,9 +233,7 @@ def test_root_endpoint():
 def test_create_todo():
     """Todo作成テスト"""
     # ストレージをクリア
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
     create_data = {
         "title": "Test Todo",
@@ -195,13 +255,11 @@ def test_create_todo():
 def test_get_todos():
     """Todo一覧取得テスト"""
     # 事前にテストデータを作成
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
     # 2つのTodoを作成
-    client.post("/api/v1/todos", json={"title": "Todo 1", "description": "First Todo"})
-    client.post("/api/v1/todos", json={"title": "Todo 2", "description": "Second Todo"})
+    _seed_todo("Todo 1", "First Todo")
+    _seed_todo("Todo 2", "Second Todo")
     
     response = client.get("/api/v1/todos")
     assert response.status_code == 200
@@ -213,15 +271,33 @@ def test_get_todos():
     assert len(data["items"]) == 2
     print("✅ Todo一覧取得成功")
 
+def test_get_todos_not_modified():
+    """一覧取得のETag（If-None-Match一致時は304）テスト"""
+    reset_storage()
+    _seed_todo("ETag Todo")
+    
+    response = client.get("/api/v1/todos")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    
+    # 変更がなければ304で本文なし
+    not_modified = client.get("/api/v1/todos", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    
+    # 更新するとETagが変わり、古いETagでは200が返る
+    client.patch("/api/v1/todos/1", json={"completed": True})
+    modified = client.get("/api/v1/todos", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["etag"] != etag
+    print("✅ 一覧取得のETag確認成功")
+
 def test_get_todo_by_id():
     """特定のTodo取得テスト"""
     # 事前にテストデータを作成
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
-    create_response = client.post("/api/v1/todos", json={"title": "Get Test Todo"})
-    todo_id = create_response.json()["id"]
+    todo_id = _seed_todo("Get Test Todo")["id"]
     
     response = client.get(f"/api/v1/todos/{todo_id}")
     assert response.status_code == 200
@@ -240,12 +316,9 @@ def test_get_nonexistent_todo():
 def test_update_todo():
     """Todo更新テスト"""
     # 事前にテストデータを作成
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
-    create_response = client.post("/api/v1/todos", json={"title": "Update Test", "priority": 0})
-    todo_id = create_response.json()["id"]
+    todo_id = _seed_todo("Update Test", priority=0)["id"]
     
     update_data = {
         "completed": True,
@@ -263,12 +336,9 @@ def test_update_todo():
 def test_delete_todo():
     """Todo削除テスト（論理削除）"""
     # 事前にテストデータを作成
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
-    create_response = client.post("/api/v1/todos", json={"title": "Delete Test"})
-    todo_id = create_response.json()["id"]
+    todo_id = _seed_todo("Delete Test")["id"]
     
     response = client.delete(f"/api/v1/todos/{todo_id}", params={"permanent": False})
     assert response.status_code == 200
@@ -292,9 +362,7 @@ def test_invalid_item_id():
 
 def test_todo_priorities():
     """異なる優先度のテスト"""
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
     priorities = [0, 1, 2]
     for priority in priorities:
@@ -316,9 +384,7 @@ def test_todo_priorities():
 def test_full_todo_lifecycle():
     """Todo作成→取得→更新→削除の完全なライフサイクルテスト"""
     # ストレージをクリア
-    todo_storage.clear()
-    global next_id
-    next_id = 1
+    reset_storage()
     
     print("\n📝 Todoライフサイクルテスト開始")
     
@@ -335,8 +401,9 @@ def test_full_todo_lifecycle():
     # 2. 作成したTodoを取得
     get_response = client.get(f"/api/v1/todos/{todo_id}")
     assert get_response.status_code == 200
-    assert get_response.json()["title"] == "Lifecycle Test Todo"
-    print(f"   2. Todo取得: タイトル={get_response.json()['title']}")
+    get_data = get_response.json()
+    assert get_data["title"] == "Lifecycle Test Todo"
+    print(f"   2. Todo取得: タイトル={get_data['title']}")
     
     # 3. Todoを更新
     update_response = client.patch(f"/api/v1/todos/{todo_id}", json={
@@ -344,8 +411,9 @@ def test_full_todo_lifecycle():
         "priority": 2
     })
     assert update_response.status_code == 200
-    assert update_response.json()["completed"] == True
-    print(f"   3. Todo更新: 完了={update_response.json()['completed']}")
+    update_data = update_response.json()
+    assert update_data["completed"] == True
+    print(f"   3. Todo更新: 完了={update_data['completed']}")
     
     # 4. Todoを削除
     delete_response = client.delete(f"/api/v1/todos/{todo_id}")
@@ -363,6 +431,32 @@ def test_full_todo_lifecycle():
 # 実行とレポート
 # =====================================
 
+# 状態を変更しないテスト（並行実行しても互いに干渉しない）
+READONLY_TESTS = [
+    ("ヘルスチェック", test_health_check),
+    ("ルートエンドポイント", test_root_endpoint),
+    ("存在しないTodo取得", test_get_nonexistent_todo),
+    ("無効なTodo作成", test_invalid_todo_creation),
+    ("無効なID形式", test_invalid_item_id),
+]
+
+async def run_readonly_concurrent():
+    """読み取り系テストをスレッドで並行実行し、(名前, 成否) のリストを返す"""
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(test_func) for _, test_func in READONLY_TESTS),
+        return_exceptions=True,
+    )
+    
+    results = []
+    for (name, _), outcome in zip(READONLY_TESTS, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {name}テストエラー:")
+            traceback.print_exception(outcome)
+            results.append((name, False))
+        else:
+            results.append((name, True))
+    return results
+
 def run_all_tests():
     """すべてのテストを実行"""
     print("🔧 Event Loop Closedエラー完全解決版テスト")
@@ -370,20 +464,19 @@ def run_all_tests():
     print("💡 解決方法: データベース依存を完全に排除した独立テストアプリ")
     print("=" * 60)
     
-    test_count = 0
-    success_count = 0
+    # 読み取り系はまとめて並行実行
+    readonly_results = asyncio.run(run_readonly_concurrent())
+    test_count = len(readonly_results)
+    success_count = sum(passed for _, passed in readonly_results)
     
+    # ストレージを変更するテストは競合を避けるため順番に実行
     tests = [
-        ("ヘルスチェック", test_health_check),
-        ("ルートエンドポイント", test_root_endpoint),
         ("Todo作成", test_create_todo),
         ("Todo一覧取得", test_get_todos),
+        ("一覧取得のETag", test_get_todos_not_modified),
         ("Todo取得", test_get_todo_by_id),
-        ("存在しないTodo取得", test_get_nonexistent_todo),
         ("Todo更新", test_update_todo),
         ("Todo削除", test_delete_todo),
-        ("無効なTodo作成", test_invalid_todo_creation),
-        ("無効なID形式", test_invalid_item_id),
         ("優先度テスト", test_todo_priorities),
         ("ライフサイクルテスト", test_full_todo_lifecycle),
     ]
@@ -393,11 +486,10 @@ def run_all_tests():
         try:
             test_func()
             success_count += 1
-        except Exception as e:
-            print(f"❌ {test_name}テストエラー: {e}")
-            import traceback
+        except Exception:
+            # 例外メッセージはトレースバックの末尾に出るので、見出しだけ表示する
+            print(f"❌ {test_name}テストエラー:")
             traceback.print_exc()
-            print()
     
     print("\n" + "=" * 60)
     print(f"📊 テスト結果: {success_count}/{test_count} 成功")